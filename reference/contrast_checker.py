@@ -25,6 +25,7 @@ USAGE EXAMPLES
 The script has NO placeholders and avoids external network requests.
 It uses only the Python standard library + Pillow (PIL) for image handling (optional).
 If Pillow is missing and you don't analyze images, it still works (colors-only pipeline).
+NumPy, when installed, is used for faster dominant-color extraction from images.
 """
 
 from __future__ import annotations
@@ -35,8 +36,11 @@ import math
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 # Optional dependency for image processing
 try:
@@ -44,11 +48,27 @@ try:
 except Exception:
     Image = None  # type: ignore
 
+# Optional dependency for faster JSON serialization (json module is used without it)
+try:
+    import orjson
+except Exception:
+    orjson = None  # type: ignore
+
+# Optional dependency for faster dominant-color extraction (Pillow palette is used without it)
+try:
+    import numpy as np
+except Exception:
+    np = None  # type: ignore
+
 
 # -----------------------------
 # Utility: CSS parsing helpers
 # -----------------------------
 
+# Slides reuse a small set of color/style strings, so the string parsers below are memoized.
+# Cached values are immutable (frozen RGBA, read-only style mappings) and safe to share.
+PARSE_CACHE_SIZE = 4096
+
 CSS_COLOR_KEYWORDS = {
     # CSS Level 1/2/3 keywords (subset commonly met; full list can be added if needed)
     "black": (0, 0, 0),
@@ -82,13 +102,14 @@ def clamp(x: float, lo: float, hi: float) -> float:
     return lo if x < lo else hi if x > hi else x
 
 
-def parse_style(style: str) -> Dict[str, str]:
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_style(style: str) -> "MappingProxyType[str, str]":
     """
-    Parse inline CSS style string into a dict of lower-case property->value.
+    Parse inline CSS style string into a read-only mapping of lower-case property->value.
     """
     result: Dict[str, str] = {}
     if not style:
-        return result
+        return MappingProxyType(result)
     for part in style.split(";"):
         if not part.strip():
             continue
@@ -96,9 +117,10 @@ def parse_style(style: str) -> Dict[str, str]:
             continue
         k, v = part.split(":", 1)
         result[k.strip().lower()] = v.strip()
-    return result
+    return MappingProxyType(result)
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_length_px(v: str) -> Optional[float]:
     """
     Parse something like '123px' or '12.5px' into float pixels.
@@ -111,8 +133,11 @@ def parse_length_px(v: str) -> Optional[float]:
     return None
 
 
-@dataclass
-class RGBA:
+class RGBA(NamedTuple):
+    """
+    Color as a plain (r, g, b, a) tuple: hashable, immutable and cheap to allocate,
+    with named access for readability.
+    """
     r: int
     g: int
     b: int
@@ -122,10 +147,10 @@ class RGBA:
         return RGBA(int(clamp(self.r, 0, 255)), int(clamp(self.g, 0, 255)), int(clamp(self.b, 0, 255)), clamp(self.a, 0.0, 1.0))
 
     def to_rgb_tuple(self) -> Tuple[int, int, int]:
-        c = self.clamp255()
-        return (c.r, c.g, c.b)
+        return (int(clamp(self.r, 0, 255)), int(clamp(self.g, 0, 255)), int(clamp(self.b, 0, 255)))
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_css_color(s: Optional[str]) -> Optional[RGBA]:
     """
     Parse a CSS color string (hex3/4/6/8, rgb/rgba, hsl/hsla, keywords).
@@ -213,24 +238,20 @@ def parse_css_color(s: Optional[str]) -> Optional[RGBA]:
     return None
 
 
+# For each 60-degree hue sector: which of (c, x, 0) goes to r, g and b
+_HSL_SECTOR = ((0, 1, 2), (1, 0, 2), (2, 0, 1), (2, 1, 0), (1, 2, 0), (0, 2, 1))
+
+
 def hsl_to_rgb(h: float, s: float, l: float) -> Tuple[int, int, int]:
     # Convert HSL to RGB, all in [0,1] ranges except h in degrees
     c = (1 - abs(2 * l - 1)) * s
     h_ = (h % 360) / 60.0
     x = c * (1 - abs((h_ % 2) - 1))
     r1 = g1 = b1 = 0.0
-    if 0 <= h_ < 1:
-        r1, g1, b1 = c, x, 0
-    elif 1 <= h_ < 2:
-        r1, g1, b1 = x, c, 0
-    elif 2 <= h_ < 3:
-        r1, g1, b1 = 0, c, x
-    elif 3 <= h_ < 4:
-        r1, g1, b1 = 0, x, c
-    elif 4 <= h_ < 5:
-        r1, g1, b1 = x, 0, c
-    elif 5 <= h_ < 6:
-        r1, g1, b1 = c, 0, x
+    if 0 <= h_ < 6:
+        vals = (c, x, 0.0)
+        ri, gi, bi = _HSL_SECTOR[int(h_)]
+        r1, g1, b1 = vals[ri], vals[gi], vals[bi]
     m = l - c / 2
     r = int(round((r1 + m) * 255))
     g = int(round((g1 + m) * 255))
@@ -247,9 +268,15 @@ def blend_over(over: RGBA, under: Tuple[int, int, int]) -> Tuple[int, int, int]:
     Alpha-composite OVER on top of UNDER (under has implicit alpha=1).
     """
     a = clamp(over.a, 0.0, 1.0)
-    r = int(round(over.r * a + under[0] * (1 - a)))
-    g = int(round(over.g * a + under[1] * (1 - a)))
-    b = int(round(over.b * a + under[2] * (1 - a)))
+    # Opaque / fully transparent layers need no arithmetic
+    if a == 1.0:
+        return (int(round(over.r)), int(round(over.g)), int(round(over.b)))
+    if a == 0.0:
+        return (int(round(under[0])), int(round(under[1])), int(round(under[2])))
+    ia = 1 - a
+    r = int(round(over.r * a + under[0] * ia))
+    g = int(round(over.g * a + under[1] * ia))
+    b = int(round(over.b * a + under[2] * ia))
     return (r, g, b)
 
 
@@ -259,6 +286,26 @@ def blend_chain(tops: List[RGBA], bottom: Tuple[int, int, int]) -> Tuple[int, in
     Example: blend_chain([base_color, custom_theme], image_pixel)
     Means: put base_color over custom_theme over image.
     """
+    # Nothing below the topmost opaque layer is visible: drop those layers and the bottom color
+    cover = _opaque_layer_index(tops)
+    if cover is not None:
+        return _blend_chain_cached(tuple(tops[:cover + 1]), (0, 0, 0))
+    # Layers are immutable RGBA tuples, so each (layers, color) composite is computed once
+    return _blend_chain_cached(tuple(tops), tuple(bottom))
+
+
+def _opaque_layer_index(tops: List[RGBA]) -> Optional[int]:
+    """
+    Index of the topmost fully opaque layer (first item is the TOPMOST), or None.
+    """
+    for i, over in enumerate(tops):
+        if over.a >= 1.0:
+            return i
+    return None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _blend_chain_cached(tops: Tuple[RGBA, ...], bottom: Tuple[int, int, int]) -> Tuple[int, int, int]:
     res = bottom
     # We apply from LAST to FIRST (bottom-most first) to follow painter's model
     for over in reversed(tops):
@@ -273,21 +320,43 @@ def srgb_to_linear(c: float) -> float:
     return ((c + 0.055) / 1.055) ** 2.4
 
 
+# Linearized value of every 8-bit channel: integer channels need a table index, not a pow()
+_SRGB_LIN_LUT: Tuple[float, ...] = tuple(srgb_to_linear(c) for c in range(256))
+
+
+def _channel_to_linear(c: float) -> float:
+    if type(c) is int and 0 <= c <= 255:
+        return _SRGB_LIN_LUT[c]
+    return srgb_to_linear(c)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _relative_luminance_rgb(r: float, g: float, b: float) -> float:
+    return 0.2126 * _channel_to_linear(r) + 0.7152 * _channel_to_linear(g) + 0.0722 * _channel_to_linear(b)
+
+
 def relative_luminance(rgb: Tuple[int, int, int]) -> float:
-    r_lin = srgb_to_linear(rgb[0])
-    g_lin = srgb_to_linear(rgb[1])
-    b_lin = srgb_to_linear(rgb[2])
-    return 0.2126 * r_lin + 0.7152 * g_lin + 0.0722 * b_lin
+    # Decks reuse a handful of colors, so luminance is memoized per (r, g, b)
+    return _relative_luminance_rgb(rgb[0], rgb[1], rgb[2])
 
 
-def contrast_ratio(fg: Tuple[int, int, int], bg: Tuple[int, int, int]) -> float:
-    L1 = relative_luminance(fg)
-    L2 = relative_luminance(bg)
+def contrast_ratio_from_luminance(L1: float, L2: float) -> float:
     Lmax = max(L1, L2)
     Lmin = min(L1, L2)
     return (Lmax + 0.05) / (Lmin + 0.05)
 
 
+def contrast_ratio(fg: Tuple[int, int, int], bg: Tuple[int, int, int]) -> float:
+    # Any 3-sequence is accepted; the cache is keyed on tuples
+    return _contrast_ratio_cached(tuple(fg), tuple(bg))
+
+
+@lru_cache(maxsize=16384)
+def _contrast_ratio_cached(fg: Tuple[int, int, int], bg: Tuple[int, int, int]) -> float:
+    # Memoized per (fg, bg) pair: decks repeat the same text colors over the same backgrounds
+    return contrast_ratio_from_luminance(relative_luminance(fg), relative_luminance(bg))
+
+
 # ---------------------------------------
 # HTML parsing (lightweight, regex-based)
 # ---------------------------------------
@@ -298,53 +367,59 @@ SPAN_RE = re.compile(r'<span[^>]*?>|</span>', re.IGNORECASE)
 COLOR_IN_STYLE_RE = re.compile(r'color\s*:\s*([^;]+)', re.IGNORECASE)
 FS_IN_STYLE_RE = re.compile(r'font-size\s*:\s*([^;]+)', re.IGNORECASE)
 FW_IN_STYLE_RE = re.compile(r'font-weight\s*:\s*([^;]+)', re.IGNORECASE)
+# color / font-size / font-weight declarations of a span style in one pass
+# (anchored at declaration start, so background-color or border-color do not match "color")
+STYLE_TOKENS_RE = re.compile(r'(?:^|;)\s*(color|font-size|font-weight)\s*:\s*([^;]+)', re.IGNORECASE)
 WRAPPER_STYLE_RE = re.compile(r'class\s*=\s*"[^"]*entity__wrapper[^"]*"[^>]*style\s*=\s*"([^"]*)"')
 
+# Wrapper styles, entity ids and span styles in document order, for a single-pass scan.
+# The wrapper's style and own id are read with lookaheads so the match ends at its class attribute
+# and an id="text-..." later in the same tag is still scanned as an entity id.
+ENTITY_TOKENS_RE = re.compile(
+    r'(?P<wrap>class\s*=\s*"[^"]*entity__wrapper[^"]*"(?=[^>]*style\s*=\s*"(?P<wrap_style>[^"]*)")'
+    r'(?P<wrap_has_id>(?=[^>]*\bid\s*=\s*"text-))?)'
+    r'|(?P<id>id\s*=\s*"(?P<ent_id>text-[A-Za-z0-9_\-]+)")'
+    r'|(?P<span><span[^>]*style\s*=\s*"(?P<span_style>[^"]*)")',
+    re.IGNORECASE,
+)
+
+
 def extract_entities_html(content_html: str) -> List[Dict[str, Any]]:
     """
     Very lightweight HTML scanner to find entity blocks and their inner spans.
     Returns list of dicts:
-      { "id": "...", "raw": "<div ...>...</div>", "wrapper_style": "...", "spans": [ {"style": "..."} ... ] }
-    We assume entities have ids like text-... and are inside a wrapper div with class entity__wrapper that carries geometry.
+      { "id": "...", "raw": "<div ...>...</div>", "wrapper_style": "...", "spans_styles": ["...", ...] }
+    We assume entities have ids like text-... and an entity__wrapper div carrying the geometry, either inside
+    the entity (<div id="text-1"><div class="entity__wrapper" ...>) or right before it.
+
+    The HTML is scanned once, in document order: a wrapper belongs to the current entity if it has none yet,
+    otherwise (or when the wrapper tag itself has the next entity's id) it is kept for the next entity;
+    spans belong to the most recent entity.
     """
     entities: List[Dict[str, Any]] = []
-
-    # Split roughly by 'id="text-...' occurrences to isolate entities
-    parts = ENTITY_ID_RE.split(content_html)
-    # ENTITY_ID_RE splits into [pre, id1, rest1, id2, rest2, ...]
-    if len(parts) <= 1:
-        return entities
-
-    pre = parts[0]
-    for i in range(1, len(parts), 2):
-        ent_id = parts[i]
-        rest = parts[i + 1] if i + 1 < len(parts) else ""
-        # Try to cut this entity HTML until the next entity id or end
-        next_match = ENTITY_ID_RE.search(rest)
-        if next_match:
-            raw = rest[:next_match.start()]
-        else:
-            raw = rest
-
-        # Find nearest wrapper style before this entity's markup (heuristic)
-        # Search backwards from the start of raw in 'pre + raw' for entity__wrapper style
-        search_region = pre[-2000:] + raw[:2000]  # limit context
-        w = WRAPPER_STYLE_RE.search(search_region)
-        wrapper_style = w.group(1) if w else ""
-
-        # Collect spans inside raw
-        spans_styles = []
-        for m in re.finditer(r'<span[^>]*style\s*=\s*"([^"]*)"', raw, re.IGNORECASE):
-            spans_styles.append(m.group(1))
-
-        entities.append({
-            "id": ent_id,
-            "raw": raw,
-            "wrapper_style": wrapper_style,
-            "spans_styles": spans_styles,
-        })
-
-        pre = rest  # advance
+    current: Optional[Dict[str, Any]] = None
+    current_end = 0
+    pending_wrapper = ""
+
+    for m in ENTITY_TOKENS_RE.finditer(content_html):
+        if m.group("id"):
+            if current is not None:
+                current["raw"] = content_html[current_end:m.start()]
+            current = {"id": m.group("ent_id"), "raw": "", "wrapper_style": pending_wrapper, "spans_styles": []}
+            current_end = m.end()
+            pending_wrapper = ""
+            entities.append(current)
+        elif m.group("wrap"):
+            # A wrapper tag carrying its own entity id always belongs to that (next) entity
+            if current is not None and not current["wrapper_style"] and m.group("wrap_has_id") is None:
+                current["wrapper_style"] = m.group("wrap_style")
+            else:
+                pending_wrapper = m.group("wrap_style")
+        elif current is not None:
+            current["spans_styles"].append(m.group("span_style"))
+
+    if current is not None:
+        current["raw"] = content_html[current_end:]
 
     return entities
 
@@ -365,13 +440,24 @@ def parse_font_size_px(s: str) -> Optional[float]:
     return None
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_font_weight(s: str) -> Optional[str]:
     if not s:
         return None
     m = re.search(r'font-weight\s*:\s*([^;]+)', s, re.IGNORECASE)
     if not m:
         return None
-    v = m.group(1).strip().lower()
+    return parse_font_weight_value(m.group(1))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_font_weight_value(v: str) -> Optional[str]:
+    """
+    Normalize a font-weight value ('bold', '700', ...) to 'bold' or 'normal'.
+    """
+    if not v:
+        return None
+    v = v.strip().lower()
     # normalize numeric weights
     if v.isdigit():
         n = int(v)
@@ -383,20 +469,29 @@ def parse_font_weight(s: str) -> Optional[str]:
 # Image helpers: dominant colors under a region
 # ---------------------------------------
 
+# Regions larger than this (on their longest side) are downsampled before color extraction
+DOMINANT_MAX_DIM = 100
+
+
 def dominant_colors_pil(img: "Image.Image", bbox: Tuple[int, int, int, int], k: int = 5) -> List[Tuple[Tuple[int, int, int], float]]:
     """
     Get top-K dominant colors for a region bbox=(left, top, right, bottom) using Pillow's adaptive palette.
     Returns list of (rgb, weight) with weights summing to ~1.0.
     """
     region = img.crop(bbox)
-    # Reduce size for performance
-    max_dim = 256
+    # Reduce size for performance: ~100px keeps the color statistics. NEAREST is the cheapest
+    # filter and, unlike LANCZOS/BOX, creates no blended edge colors that would show up as
+    # spurious (worst-case) background colors
     w, h = region.size
-    scale = min(1.0, max_dim / max(w, h)) if max(w, h) > max_dim else 1.0
-    if scale < 1.0:
-        region = region.resize((max(1, int(w * scale)), max(1, int(h * scale))), Image.LANCZOS)
-    # Convert to palette with k colors
-    pal_img = region.convert("P", palette=Image.ADAPTIVE, colors=max(1, k))
+    if w * h > DOMINANT_MAX_DIM * DOMINANT_MAX_DIM and max(w, h) > DOMINANT_MAX_DIM:
+        scale = DOMINANT_MAX_DIM / max(w, h)
+        region = region.resize((max(1, int(w * scale)), max(1, int(h * scale))), Image.NEAREST)
+    if np is not None:
+        doms = _dominant_colors_histogram(np.asarray(region.convert("RGB"), dtype=np.uint8).reshape(-1, 3), k)
+        if doms:
+            return doms
+    # Convert to palette with k colors (fast octree, no dithering: only the palette and counts matter)
+    pal_img = region.quantize(colors=max(1, k), method=Image.FASTOCTREE, dither=Image.NONE)
     pal = pal_img.getpalette()
     color_counts = pal_img.getcolors()
     if not color_counts:
@@ -422,10 +517,88 @@ def dominant_colors_pil(img: "Image.Image", bbox: Tuple[int, int, int, int], k:
     return result
 
 
+def _dominant_colors_histogram(pixels: "np.ndarray", k: int) -> List[Tuple[Tuple[int, int, int], float]]:
+    """
+    Top-K colors of (N, 3) uint8 pixels from a 12-bit (4 bits per channel) color histogram, using NumPy.
+    Each color is the mean of the pixels in its bin. Returns [] when there are no pixels.
+    """
+    if not len(pixels):
+        return []
+    q = (pixels >> 4).astype(np.intp)
+    bins = (q[:, 0] << 8) | (q[:, 1] << 4) | q[:, 2]
+    counts = np.bincount(bins, minlength=4096)
+    n = min(max(1, k), int(np.count_nonzero(counts)))
+    top = np.argpartition(counts, -n)[-n:]
+    top = top[np.lexsort((top, -counts[top]))]  # most frequent first, ties by bin index
+    top_counts = counts[top]
+    means = np.stack(
+        [np.bincount(bins, weights=pixels[:, c], minlength=4096)[top] / top_counts for c in range(3)], axis=1
+    )
+    colors = np.rint(means).astype(int).tolist()
+    weights = (top_counts / top_counts.sum()).tolist()
+    return [((r, g, b), w) for (r, g, b), w in zip(colors, weights)]
+
+
+def _nearest_indices(n_src: int, n_dst: int) -> "np.ndarray":
+    # Source rows/columns sampled by Pillow's NEAREST resize: it starts at half a step and keeps
+    # adding the step in floating point, so accumulate the same way to pick the same pixels
+    step = n_src / n_dst
+    steps = np.full(n_dst, step)
+    steps[0] = step * 0.5
+    return np.cumsum(steps).astype(np.intp)
+
+
+def dominant_colors_np(pixels: "np.ndarray", k: int = 5) -> List[Tuple[Tuple[int, int, int], float]]:
+    """
+    Same as dominant_colors_pil for an (H, W, 3) uint8 region that is already a NumPy array
+    (e.g. a slice of the whole decoded image). Returns [] for an empty region.
+    """
+    h, w = pixels.shape[:2]
+    if w * h > DOMINANT_MAX_DIM * DOMINANT_MAX_DIM and max(w, h) > DOMINANT_MAX_DIM:
+        scale = DOMINANT_MAX_DIM / max(w, h)
+        rows = _nearest_indices(h, max(1, int(h * scale)))
+        cols = _nearest_indices(w, max(1, int(w * scale)))
+        pixels = pixels.take(rows, axis=0).take(cols, axis=1)
+    return _dominant_colors_histogram(pixels.reshape(-1, 3), k)
+
+
+@lru_cache(maxsize=8)
+def _open_rgb_cached(path: str, mtime_ns: int) -> "Image.Image":
+    img = Image.open(path).convert("RGB")
+    img.load()
+    return img
+
+
+def open_rgb_image(path: str) -> "Image.Image":
+    """
+    Open an image as RGB, reusing the decoded image across slides while the file is unchanged.
+    The returned image is shared: callers must not modify it in place.
+    """
+    return _open_rgb_cached(os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _open_rgb_array_cached(path: str, mtime_ns: int) -> "np.ndarray":
+    return np.asarray(_open_rgb_cached(path, mtime_ns), dtype=np.uint8)
+
+
+def open_rgb_array(path: str) -> "np.ndarray":
+    """
+    Like open_rgb_image, as a read-only (H, W, 3) uint8 array (requires NumPy).
+    Regions are zero-copy slices of it.
+    """
+    return _open_rgb_array_cached(os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+
 # ---------------------------------------
 # Core analysis per slide
 # ---------------------------------------
 
+# Thread pool for per-entity analysis (only used for image-backed slides with enough entities)
+PARALLEL_MIN_ENTITIES = 4
+PARALLEL_MAX_WORKERS = 8
+
+
 @dataclass
 class EntityResult:
     id: str
@@ -468,12 +641,14 @@ def analyze_slide(slide: Dict[str, Any], bg_image_path: Optional[str]=None, k_co
     if base_color:  # base_color has higher priority (should be on top)
         overlay_layers.append(base_color)
 
-    # Prepare background image if available
-    pil_img = None
-    if Image is not None:
+    # Prepare background image if available (and visible: an opaque overlay hides it completely,
+    # so its decode and dominant-color extraction would be wasted)
+    # The file is only located here; it is decoded on first use by an entity
+    bg_image_file: Optional[str] = None
+    if Image is not None and _opaque_layer_index(overlay_layers) is None:
         # prefer explicit argument
         if bg_image_path and os.path.exists(bg_image_path):
-            pil_img = Image.open(bg_image_path).convert("RGB")
+            bg_image_file = bg_image_path
         else:
             # Try to find any local path in slide_images
             imgs = slide.get("slide_images") or []
@@ -482,9 +657,9 @@ def analyze_slide(slide: Dict[str, Any], bg_image_path: Optional[str]=None, k_co
                 for key in ("path", "local_path", "file"):
                     p = im.get(key) if isinstance(im, dict) else None
                     if p and os.path.exists(p):
-                        pil_img = Image.open(p).convert("RGB")
+                        bg_image_file = p
                         break
-                if pil_img is not None:
+                if bg_image_file is not None:
                     break
 
     # Extract HTML content
@@ -499,28 +674,62 @@ def analyze_slide(slide: Dict[str, Any], bg_image_path: Optional[str]=None, k_co
 
     entities = extract_entities_html(content_html)
 
-    results: List[EntityResult] = []
-
     # Canvas default underneath everything (common for slide tools)
     canvas_rgb = (255, 255, 255)
 
     # If there is no image, we can compute one effective background color for entire slide
     global_effective_bg = None
-    if pil_img is None:
+    if bg_image_file is None:
         global_effective_bg = blend_chain(overlay_layers, canvas_rgb)
 
-    for ent in entities:
+    pil_img = None
+
+    def get_image() -> "Image.Image":
+        nonlocal pil_img
+        if pil_img is None:
+            pil_img = open_rgb_image(bg_image_file)
+        return pil_img
+
+    bg_np = None
+
+    def get_array() -> "np.ndarray":
+        nonlocal bg_np
+        if bg_np is None:
+            bg_np = open_rgb_array(bg_image_file)
+        return bg_np
+
+    # Entities often share a wrapper geometry (or have none, i.e. the whole image): extract each
+    # region's dominant colors and apply the overlay layers once per slide
+    region_cache: Dict[Tuple[int, int, int, int], List[Tuple[Tuple[int, int, int], float]]] = {}
+
+    def region_colors(bbox: Tuple[int, int, int, int]) -> List[Tuple[Tuple[int, int, int], float]]:
+        if bbox not in region_cache:
+            doms = []
+            if np is not None:
+                left, top, right, bottom = bbox
+                doms = dominant_colors_np(get_array()[top:bottom, left:right], k=k_colors)
+            if not doms:
+                doms = dominant_colors_pil(get_image(), bbox, k=k_colors)
+            region_cache[bbox] = [(blend_chain(overlay_layers, rgb), w) for rgb, w in doms]
+        return region_cache[bbox]
+
+    def analyze_entity(ent: Dict[str, Any]) -> EntityResult:
         ent_id = ent["id"]
         spans_styles: List[str] = ent.get("spans_styles", [])
 
+        # color / font-size / font-weight of each span, extracted in a single regex pass
+        spans_tokens = [
+            {m.group(1).lower(): m.group(2).strip() for m in STYLE_TOKENS_RE.finditer(st or "")}
+            for st in spans_styles
+        ]
+
         # Collect text colors (unique) + approx coverage (equal weights for spans if unknown length)
         text_colors: List[Tuple[Tuple[int, int, int], str, float]] = []
-        if spans_styles:
-            portion = 1.0 / len(spans_styles)
-            for st in spans_styles:
+        if spans_tokens:
+            portion = 1.0 / len(spans_tokens)
+            for tokens in spans_tokens:
                 # parse color
-                m = COLOR_IN_STYLE_RE.search(st or "")
-                css_color = m.group(1).strip() if m else color_text_default
+                css_color = tokens.get("color", color_text_default)
                 rgba = parse_css_color(css_color) or parse_css_color(color_text_default) or RGBA(0, 0, 0, 1.0)
                 text_colors.append((rgba.to_rgb_tuple(), css_color, portion))
         else:
@@ -530,13 +739,13 @@ def analyze_slide(slide: Dict[str, Any], bg_image_path: Optional[str]=None, k_co
         # Font size / weight (fallbacks)
         font_size_px = None
         font_weight = None
-        for st in spans_styles:
+        for tokens in spans_tokens:
             if font_size_px is None:
-                fs = parse_font_size_px(st)
+                fs = parse_font_size_px(tokens.get("font-size", ""))
                 if fs is not None:
                     font_size_px = fs
             if font_weight is None:
-                fw = parse_font_weight(st)
+                fw = parse_font_weight_value(tokens.get("font-weight", ""))
                 if fw is not None:
                     font_weight = fw
         if font_size_px is None:
@@ -556,30 +765,22 @@ def analyze_slide(slide: Dict[str, Any], bg_image_path: Optional[str]=None, k_co
 
         # Determine background colors under entity
         bg_colors: List[Tuple[Tuple[int, int, int], float]] = []
-        if pil_img is not None and all(v is not None for v in (left, top, width, height)):
+        if bg_image_file is not None and all(v is not None for v in (left, top, width, height)):
             # Crop region from image
+            img = get_image()
             L = max(0, int(round(left or 0)))
             T = max(0, int(round(top or 0)))
-            R = max(L + 1, int(round((left or 0) + (width or pil_img.width))))
-            B = max(T + 1, int(round((top or 0) + (height or pil_img.height))))
-            R = min(R, pil_img.width)
-            B = min(B, pil_img.height)
-            doms = dominant_colors_pil(pil_img, (L, T, R, B), k=k_colors)
-            # Apply overlay layers to each dominant color
-            effective = []
-            for rgb, w in doms:
-                eff = blend_chain(overlay_layers, rgb)
-                effective.append((eff, w))
-            bg_colors = effective
+            R = max(L + 1, int(round((left or 0) + (width or img.width))))
+            B = max(T + 1, int(round((top or 0) + (height or img.height))))
+            R = min(R, img.width)
+            B = min(B, img.height)
+            # Dominant colors with overlay layers applied
+            bg_colors = region_colors((L, T, R, B))
             bg_method = "dominant_color_after_blend"
-        elif pil_img is not None:
+        elif bg_image_file is not None:
             # No geometry → use whole image
-            doms = dominant_colors_pil(pil_img, (0, 0, pil_img.width, pil_img.height), k=k_colors)
-            effective = []
-            for rgb, w in doms:
-                eff = blend_chain(overlay_layers, rgb)
-                effective.append((eff, w))
-            bg_colors = effective
+            img = get_image()
+            bg_colors = region_colors((0, 0, img.width, img.height))
             bg_method = "dominant_color_after_blend"
         else:
             # No image → only colors
@@ -588,17 +789,20 @@ def analyze_slide(slide: Dict[str, Any], bg_image_path: Optional[str]=None, k_co
             bg_method = "composited_color"
 
         # Compute minimal contrast for this entity
+        # Background luminances are shared by all text colors of the entity
+        bg_lums = [relative_luminance(bg) for bg, _ in bg_colors]
         per_text = []
         min_ratio = float("inf")
         for rgb_text, css, w_text in text_colors:
             # Worst-case background among dominant bg colors
-            worst_for_text = min(contrast_ratio(rgb_text, bg) for bg, w_bg in bg_colors)
+            L_text = relative_luminance(rgb_text)
+            worst_for_text = min(contrast_ratio_from_luminance(L_text, L_bg) for L_bg in bg_lums)
             per_text.append({"css": css, "rgb": list(rgb_text), "ratio": round(worst_for_text, 4)})
             min_ratio = min(min_ratio, worst_for_text)
 
         wcag = classify_wcag(min_ratio, font_size_px, font_weight)
 
-        results.append(EntityResult(
+        return EntityResult(
             id=ent_id,
             text_colors=[{"css": t["css"], "rgb": t["rgb"], "coverage": 1.0/len(text_colors) if len(text_colors)>0 else 1.0} for t in per_text],
             font={"size_px": round(float(font_size_px), 2), "weight": font_weight},
@@ -611,13 +815,27 @@ def analyze_slide(slide: Dict[str, Any], bg_image_path: Optional[str]=None, k_co
                 "by_text_color": per_text,
                 "wcag": wcag
             }
-        ))
+        )
+
+    # Entities are independent. With an image, most of their time is region cropping/quantization in
+    # Pillow/NumPy C code that releases the GIL, so larger slides are analyzed on a thread pool.
+    # Results keep entity order; the per-slide caches are only ever filled with identical values.
+    max_workers = min(PARALLEL_MAX_WORKERS, len(entities), os.cpu_count() or 1)
+    if bg_image_file is not None and len(entities) >= PARALLEL_MIN_ENTITIES and max_workers > 1:
+        # decode once, before the workers share it
+        get_image()
+        if np is not None:
+            get_array()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(analyze_entity, entities))
+    else:
+        results = [analyze_entity(ent) for ent in entities]
 
     # Prepare final JSON
     out = {
         "slide_id": slide_id,
         "background": {
-            "source": "image+colors" if pil_img is not None else "colors_only",
+            "source": "image+colors" if bg_image_file is not None else "colors_only",
             "effective_rgb": list(global_effective_bg) if global_effective_bg else None
         },
         "entities": [er.__dict__ for er in results]
@@ -634,6 +852,15 @@ def load_json(path: str) -> Any:
         return json.load(f)
 
 
+def dumps_json(obj: Any) -> str:
+    """
+    Serialize to indented JSON (non-ASCII kept as-is), using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Compute text/background contrast for slide HTML+JSON (WCAG 2.2).")
     parser.add_argument("--slide-json", required=True, help="Path to slide JSON (object or array).")
@@ -656,7 +883,8 @@ def main():
         slide = data
 
     result = analyze_slide(slide, bg_image_path=args.bg_image, k_colors=args.k)
-    text = json.dumps(result, ensure_ascii=False, indent=2)
+    # Serialized once, then printed and written
+    text = dumps_json(result)
     print(text)
     if args.out:
         with open(args.out, "w", encoding="utf-8") as f:
@@ -1,143 +1,372 @@
 """Batch analyzer for processing multiple slides."""
 
+import asyncio
 import json
-import subprocess
+import os
+from multiprocessing import Pool, TimeoutError as PoolTimeoutError, cpu_count
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.contrast_checker import analyze_slide
+from src.report_generator import generate_html_report
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+SEPARATOR = "=" * 60
+
+# Per-slide report blocks, printed with a single call each so the lines of one slide
+# stay together and stdout is written once per slide
+SLIDE_HEADER_TMPL = "\n[{idx}/{total}] Analyzing {name}...\n"
+SLIDE_OK_TMPL = (
+    "  [OK] Success!\n"
+    "    Total entities: {total_entities}\n"
+    "    Passed AA: {passed_AA_normal}\n"
+    "    Failed AA: {failed_AA_normal}"
+)
+SLIDE_SKIP_TMPL = "  [SKIP] Up to date: {result_json}"
+SLIDE_FAIL_TMPL = "  [FAIL] Failed!\n    Error: {error}"
+SLIDE_TIMEOUT_TMPL = "  [TIMEOUT] Timeout!"
+SLIDE_ERROR_TMPL = "  [ERROR] Error: {error}"
+
+# Longest in-process analysis of one slide (as the former per-slide CLI run allowed)
+ANALYSIS_TIMEOUT_S = 60
+
+# Longest wait for the next answer of the Docker serve container, and for it to exit once stopped
+SLIDE_TIMEOUT_S = 120
+STOP_GRACE_S = 5
+
+
+def _find_slide_files(slides_path: Path) -> List[Path]:
+    """List the slide_*.json files of a directory, sorted by name."""
+    # A single scandir pass: entry types come with the directory listing
+    with os.scandir(slides_path) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.name.startswith("slide_") and entry.name.endswith(".json") and entry.is_file()
+        ]
+    return [slides_path / name for name in sorted(names)]
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file, with orjson when it is installed (raises OSError / ValueError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Save data as indented UTF-8 JSON, encoded with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _is_up_to_date(slide_file: Path, result_json: Path) -> bool:
+    """Check whether a slide's result exists and is newer than the slide itself."""
+    try:
+        return result_json.stat().st_mtime >= slide_file.stat().st_mtime
+    except OSError:
+        return False
+
+
+def _load_existing_result(
+    slide_file: Path, result_json: Path, result_html: Path
+) -> Optional[Dict[str, Any]]:
+    """Load a previous analysis result as a batch entry (None if it is unreadable)."""
+    try:
+        analysis_data = _read_json(result_json)
+    except (OSError, ValueError):
+        return None
+
+    return {
+        "slide_file": str(slide_file),
+        "slide_id": analysis_data.get('slide_id'),
+        "summary": analysis_data.get('summary', {}),
+        "result_json": str(result_json),
+        "result_html": str(result_html),
+        "skipped": True
+    }
+
+
+BATCH_DONE_TMPL = (
+    "\n{sep}\n"
+    "{title}\n"
+    "{sep}\n"
+    "Total slides: {total}\n"
+    "Successful: {successful}\n"
+    "Failed: {failed}\n"
+    "\nResults saved to: {output_dir}/\n"
+    "Summary: {summary_file}"
+)
+
+
+def _analyze_one(task: Tuple[str, str, str, bool]) -> Dict[str, Any]:
+    """
+    Analyze one slide and save its JSON result and HTML report (runs in a worker process).
+
+    Args:
+        task: (slide JSON path, output directory, ML method, verbose)
+
+    Returns:
+        Batch entry for the slide, with an "error" key if the analysis failed
+        (including the traceback if verbose)
+    """
+    slide_file, output_dir, ml_method, verbose = task
+    slide_name = Path(slide_file).stem  # e.g., "slide_001"
+    result_json = Path(output_dir) / f"{slide_name}_result.json"
+    result_html = Path(output_dir) / f"{slide_name}_report.html"
+
+    try:
+        analysis_data = analyze_slide(slide_json_path=slide_file, ml_method=ml_method)
+
+        with open(result_json, 'w', encoding='utf-8') as f:
+            json.dump(analysis_data, f, ensure_ascii=False, indent=2)
+        generate_html_report(analysis_data, str(result_html))
+    except Exception as e:
+        error = str(e)
+        if verbose:
+            import traceback
+
+            error += "\n" + traceback.format_exc()
+        return {
+            "slide_file": slide_file,
+            "error": error
+        }
+
+    return {
+        "slide_file": slide_file,
+        "slide_id": analysis_data.get('slide_id'),
+        "summary": analysis_data.get('summary', {}),
+        "result_json": str(result_json),
+        "result_html": str(result_html)
+    }
 
 
 def analyze_slide_batch(
     slides_dir: str = "examples/slides",
     output_dir: str = "output/batch",
     ml_method: str = "mediancut",
-    verbose: bool = True
+    verbose: bool = True,
+    skip_existing: bool = False,
+    timeout: float = ANALYSIS_TIMEOUT_S
 ) -> List[Dict[str, Any]]:
     """
     Analyze all slide JSON files in a directory.
 
+    Slides are analyzed in-process by a pool of worker processes (one per CPU)
+    instead of starting a new interpreter per slide.
+
     Args:
         slides_dir: Directory containing slide JSON files
         output_dir: Directory to save analysis results
         ml_method: ML method to use (mediancut or kmeans)
-        verbose: Print verbose output
+        verbose: Include the traceback in the error of a failed slide
+        skip_existing: Reuse results that are newer than their slide JSON
+            instead of analyzing the slide again
+        timeout: Longest analysis time in seconds for one slide; a slide that takes
+            longer is reported as timed out and its worker process is stopped
 
     Returns:
-        List of analysis results
+        List of analysis results, in slide order
     """
     slides_path = Path(slides_dir)
     if not slides_path.exists():
         raise FileNotFoundError(f"Slides directory not found: {slides_dir}")
 
     # Find all JSON files
-    json_files = sorted(slides_path.glob("slide_*.json"))
+    json_files = _find_slide_files(slides_path)
 
     if not json_files:
         print(f"No slide JSON files found in {slides_dir}")
         return []
 
-    print(f"Found {len(json_files)} slides to analyze")
-    print(f"{'='*60}")
+    total = len(json_files)
+    print(f"Found {total} slides to analyze")
+    print(SEPARATOR)
 
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
     results = []
+    tasks = []
+
+    def report(block: str, name: str) -> None:
+        header = SLIDE_HEADER_TMPL.format(idx=len(results), total=total, name=name)
+        print(header + block)
+
+    for json_file in json_files:
+        result_json = output_path / f"{json_file.stem}_result.json"
+        result_html = output_path / f"{json_file.stem}_report.html"
+
+        if skip_existing and _is_up_to_date(json_file, result_json):
+            existing = _load_existing_result(json_file, result_json, result_html)
+            if existing is not None:
+                results.append(existing)
+                report(SLIDE_SKIP_TMPL.format(result_json=result_json), json_file.name)
+                continue
+
+        tasks.append((str(json_file), str(output_path), ml_method, verbose))
+
+    def collect(entry: Dict[str, Any]) -> None:
+        results.append(entry)
+        name = Path(entry["slide_file"]).name
+        if 'error' in entry:
+            report(SLIDE_FAIL_TMPL.format(error=entry["error"]), name)
+        else:
+            summary = entry["summary"]
+            report(SLIDE_OK_TMPL.format(
+                total_entities=summary.get('total_entities', 0),
+                passed_AA_normal=summary.get('passed_AA_normal', 0),
+                failed_AA_normal=summary.get('failed_AA_normal', 0),
+            ), name)
+
+    # Results are awaited in slide order, each for at most `timeout` once the previous
+    # slide is done (workers pick slides up in that order, so by then it is running).
+    # Leaving the `with` block terminates the pool, stuck worker included; the slides
+    # it had not finished go to a fresh pool.
+    while tasks:
+        with Pool(min(len(tasks), cpu_count())) as pool:
+            submitted = [(task, pool.apply_async(_analyze_one, (task,))) for task in tasks]
+            tasks = []
+            for idx, (task, async_result) in enumerate(submitted):
+                try:
+                    entry = async_result.get(timeout)
+                except PoolTimeoutError:
+                    results.append({
+                        "slide_file": task[0],
+                        "error": "Analysis timed out"
+                    })
+                    report(SLIDE_TIMEOUT_TMPL, Path(task[0]).name)
+                    for later_task, later_result in submitted[idx + 1:]:
+                        if later_result.ready():
+                            collect(later_result.get())
+                        else:
+                            tasks.append(later_task)
+                    break
+                collect(entry)
+
+    slide_order = {str(json_file): idx for idx, json_file in enumerate(json_files)}
+    results.sort(key=lambda r: slide_order[r["slide_file"]])
 
-    for idx, json_file in enumerate(json_files, 1):
-        print(f"\n[{idx}/{len(json_files)}] Analyzing {json_file.name}...")
-
-        # Generate output filenames
-        slide_name = json_file.stem  # e.g., "slide_001"
-        result_json = output_path / f"{slide_name}_result.json"
-        result_html = output_path / f"{slide_name}_report.html"
-
-        # Build command
-        cmd = [
-            "python", "-m", "src.cli",
-            "--slide-json", str(json_file),
-            "--out-json", str(result_json),
-            "--out-html", str(result_html),
-            "--ml-method", ml_method
-        ]
+    # Save batch summary
+    summary_file = output_path / "batch_summary.json"
+    _write_json(summary_file, results)
+
+    successful = sum(1 for r in results if 'error' not in r)
+    print(BATCH_DONE_TMPL.format(
+        sep=SEPARATOR,
+        title="BATCH ANALYSIS COMPLETE",
+        total=total,
+        successful=successful,
+        failed=len(results) - successful,
+        output_dir=output_dir,
+        summary_file=summary_file,
+    ))
 
-        if verbose:
-            cmd.append("--verbose")
+    return results
 
-        # Run analysis
+
+async def _stop_process(proc: asyncio.subprocess.Process) -> None:
+    """Terminate a process, killing it if it does not exit within STOP_GRACE_S."""
+    try:
+        proc.terminate()
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode == 0:
-                # Load result
-                with open(result_json, 'r', encoding='utf-8') as f:
-                    analysis_data = json.load(f)
-
-                summary = analysis_data.get('summary', {})
-                print(f"  [OK] Success!")
-                print(f"    Total entities: {summary.get('total_entities', 0)}")
-                print(f"    Passed AA: {summary.get('passed_AA_normal', 0)}")
-                print(f"    Failed AA: {summary.get('failed_AA_normal', 0)}")
-
-                results.append({
-                    "slide_file": str(json_file),
-                    "slide_id": analysis_data.get('slide_id'),
-                    "summary": summary,
-                    "result_json": str(result_json),
-                    "result_html": str(result_html)
-                })
-            else:
-                print(f"  [FAIL] Failed!")
-                print(f"    Error: {result.stderr}")
-                results.append({
-                    "slide_file": str(json_file),
-                    "error": result.stderr
-                })
-
-        except subprocess.TimeoutExpired:
-            print(f"  [TIMEOUT] Timeout!")
-            results.append({
-                "slide_file": str(json_file),
-                "error": "Analysis timed out"
-            })
-        except Exception as e:
-            print(f"  [ERROR] Error: {e}")
-            results.append({
-                "slide_file": str(json_file),
-                "error": str(e)
-            })
+            await asyncio.wait_for(proc.wait(), STOP_GRACE_S)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+    except ProcessLookupError:
+        pass  # already exited
 
-    # Save batch summary
-    summary_file = output_path / "batch_summary.json"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-
-    print(f"\n{'='*60}")
-    print(f"BATCH ANALYSIS COMPLETE")
-    print(f"{'='*60}")
-    print(f"Total slides: {len(json_files)}")
-    print(f"Successful: {sum(1 for r in results if 'error' not in r)}")
-    print(f"Failed: {sum(1 for r in results if 'error' in r)}")
-    print(f"\nResults saved to: {output_dir}/")
-    print(f"Summary: {summary_file}")
 
-    return results
+async def _run_serve_container(
+    cmd: List[str], requests: List[str], on_response, timeout: float = SLIDE_TIMEOUT_S
+) -> str:
+    """
+    Run a serve-mode CLI command, send it all requests and pass each answer to on_response.
+
+    The requests are written while the answers and stderr are read, so no pipe can fill
+    up and stall the container.
+
+    Args:
+        cmd: Command starting the serve-mode CLI (e.g. a docker run)
+        requests: NDJSON request lines
+        on_response: Called with every decoded response, as it arrives
+        timeout: Longest wait in seconds for each answer
+
+    Returns:
+        Everything the command wrote to stderr
+
+    Raises:
+        asyncio.TimeoutError: If an answer takes longer than timeout; the command
+            is stopped (terminated, then killed) before this is raised
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+
+    async def feed() -> None:
+        try:
+            proc.stdin.writelines(line.encode("utf-8") for line in requests)
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the command exited early; its missing answers are reported by the caller
+        finally:
+            proc.stdin.close()
+
+    async def reap() -> None:
+        while True:
+            line = await asyncio.wait_for(proc.stdout.readline(), timeout)
+            if not line:
+                return
+            try:
+                on_response(json.loads(line))
+            except ValueError:
+                continue
+
+    try:
+        _, _, stderr = await asyncio.gather(feed(), reap(), proc.stderr.read())
+    except asyncio.TimeoutError:
+        # Don't leave a stuck container (or docker client) behind
+        await _stop_process(proc)
+        raise
+    await proc.wait()
+    return stderr.decode("utf-8", errors="replace")
 
 
 def analyze_slide_batch_docker(
     slides_dir: str = "examples/slides",
     output_dir: str = "output/batch",
     ml_method: str = "mediancut",
-    docker_image: str = "hse-contrast-checker"
+    docker_image: str = "hse-contrast-checker",
+    skip_existing: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Analyze all slides using Docker container.
 
+    A single container is started for the whole batch; it runs the CLI in
+    serve mode and receives the slides as NDJSON requests on stdin. If it gets
+    stuck on a slide or exits early, only that slide is reported as failed and
+    a new container is started for the slides it did not answer.
+
     Args:
         slides_dir: Directory containing slide JSON files
         output_dir: Directory to save analysis results
         ml_method: ML method to use
         docker_image: Docker image name
+        skip_existing: Reuse results that are newer than their slide JSON
+            instead of sending the slide to the container
 
     Returns:
         List of analysis results
@@ -146,14 +375,15 @@ def analyze_slide_batch_docker(
     if not slides_path.exists():
         raise FileNotFoundError(f"Slides directory not found: {slides_dir}")
 
-    json_files = sorted(slides_path.glob("slide_*.json"))
+    json_files = _find_slide_files(slides_path)
 
     if not json_files:
         print(f"No slide JSON files found in {slides_dir}")
         return []
 
-    print(f"Found {len(json_files)} slides to analyze with Docker")
-    print(f"{'='*60}")
+    total = len(json_files)
+    print(f"Found {total} slides to analyze with Docker")
+    print(SEPARATOR)
 
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -164,82 +394,126 @@ def analyze_slide_batch_docker(
     slides_abs = slides_path.resolve()
     output_abs = output_path.resolve()
 
-    for idx, json_file in enumerate(json_files, 1):
-        print(f"\n[{idx}/{len(json_files)}] Analyzing {json_file.name}...")
+    # Slides to send to the container, keyed by their path inside it
+    jobs = {}
+    done = 0
 
+    for json_file in json_files:
         slide_name = json_file.stem
-        result_json = f"/app/output/{slide_name}_result.json"
-        result_html = f"/app/output/{slide_name}_report.html"
-
-        # Build Docker command
-        cmd = [
-            "docker", "run", "--rm",
-            "-v", f"{slides_abs}:/app/slides",
-            "-v", f"{output_abs}:/app/output",
-            docker_image,
-            "--slide-json", f"/app/slides/{json_file.name}",
-            "--out-json", result_json,
-            "--out-html", result_html,
-            "--ml-method", ml_method,
-            "--verbose"
-        ]
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-
-            if result.returncode == 0:
-                # Load result
-                local_result = output_path / f"{slide_name}_result.json"
-                with open(local_result, 'r', encoding='utf-8') as f:
-                    analysis_data = json.load(f)
-
-                summary = analysis_data.get('summary', {})
-                print(f"  [OK] Success!")
-                print(f"    Total entities: {summary.get('total_entities', 0)}")
-                print(f"    Passed AA: {summary.get('passed_AA_normal', 0)}")
-                print(f"    Failed AA: {summary.get('failed_AA_normal', 0)}")
-
-                results.append({
-                    "slide_file": str(json_file),
-                    "slide_id": analysis_data.get('slide_id'),
-                    "summary": summary,
-                    "result_json": str(local_result),
-                    "result_html": str(output_path / f"{slide_name}_report.html")
-                })
-            else:
-                print(f"  [FAIL] Failed!")
-                print(f"    Error: {result.stderr}")
-                results.append({
-                    "slide_file": str(json_file),
-                    "error": result.stderr
-                })
-
-        except subprocess.TimeoutExpired:
-            print(f"  [TIMEOUT] Timeout!")
+        local_result = output_path / f"{slide_name}_result.json"
+        local_html = output_path / f"{slide_name}_report.html"
+
+        if skip_existing and _is_up_to_date(json_file, local_result):
+            existing = _load_existing_result(json_file, local_result, local_html)
+            if existing is not None:
+                done += 1
+                header = SLIDE_HEADER_TMPL.format(idx=done, total=total, name=json_file.name)
+                print(header + SLIDE_SKIP_TMPL.format(result_json=local_result))
+                results.append(existing)
+                continue
+
+        jobs[f"/app/slides/{json_file.name}"] = (json_file, local_result, local_html)
+
+    # One container for the whole batch: volumes are mounted and dependencies imported once,
+    # then the serve-mode CLI answers one NDJSON line per slide
+    cmd = [
+        "docker", "run", "--rm", "-i",
+        "-v", f"{slides_abs}:/app/slides",
+        "-v", f"{output_abs}:/app/output",
+        docker_image,
+        "--serve",
+        "--ml-method", ml_method
+    ]
+
+    def collect(response: Dict[str, Any]) -> None:
+        nonlocal done
+        job = jobs.pop(response.get("slide_json"), None)
+        if job is None:
+            return
+        json_file, local_result, local_html = job
+
+        done += 1
+        header = SLIDE_HEADER_TMPL.format(idx=done, total=total, name=json_file.name)
+        if "error" in response:
+            print(header + SLIDE_FAIL_TMPL.format(error=response["error"]))
             results.append({
                 "slide_file": str(json_file),
-                "error": "Analysis timed out"
+                "error": response["error"]
             })
+            return
+
+        summary = response.get("summary", {})
+        print(header + SLIDE_OK_TMPL.format(
+            total_entities=summary.get('total_entities', 0),
+            passed_AA_normal=summary.get('passed_AA_normal', 0),
+            failed_AA_normal=summary.get('failed_AA_normal', 0),
+        ))
+
+        results.append({
+            "slide_file": str(json_file),
+            "slide_id": response.get("slide_id"),
+            "summary": summary,
+            "result_json": str(local_result),
+            "result_html": str(local_html)
+        })
+
+    while jobs:
+        requests = [
+            json.dumps({
+                "slide_json": container_path,
+                "out_json": f"/app/output/{json_file.stem}_result.json",
+                "out_html": f"/app/output/{json_file.stem}_report.html"
+            }, ensure_ascii=False) + "\n"
+            for container_path, (json_file, _, _) in jobs.items()
+        ]
+
+        try:
+            stderr = asyncio.run(_run_serve_container(cmd, requests, collect, SLIDE_TIMEOUT_S))
+            timed_out = False
+        except asyncio.TimeoutError:
+            stderr = ""
+            timed_out = True
         except Exception as e:
-            print(f"  [ERROR] Error: {e}")
-            results.append({
-                "slide_file": str(json_file),
-                "error": str(e)
-            })
+            stderr = str(e)
+            timed_out = False
+
+        if not jobs:
+            break
+
+        # The container answers in request order, so the first unanswered slide is the one it
+        # was stuck on or died with; only that slide failed, the rest go to a new container
+        json_file, _, _ = jobs.pop(next(iter(jobs)))
+        done += 1
+        header = SLIDE_HEADER_TMPL.format(idx=done, total=total, name=json_file.name)
+        if timed_out:
+            print(header + SLIDE_TIMEOUT_TMPL)
+            error = "Analysis timed out"
+        else:
+            print(header + SLIDE_ERROR_TMPL.format(error=stderr))
+            error = stderr or "No result from container"
+        results.append({
+            "slide_file": str(json_file),
+            "error": error
+        })
+
+    # Skipped slides were added before the container answered
+    slide_order = {str(json_file): idx for idx, json_file in enumerate(json_files)}
+    results.sort(key=lambda r: slide_order[r["slide_file"]])
 
     # Save batch summary
     summary_file = output_path / "batch_summary.json"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-
-    print(f"\n{'='*60}")
-    print(f"DOCKER BATCH ANALYSIS COMPLETE")
-    print(f"{'='*60}")
-    print(f"Total slides: {len(json_files)}")
-    print(f"Successful: {sum(1 for r in results if 'error' not in r)}")
-    print(f"Failed: {sum(1 for r in results if 'error' in r)}")
-    print(f"\nResults saved to: {output_dir}/")
-    print(f"Summary: {summary_file}")
+    _write_json(summary_file, results)
+
+    successful = sum(1 for r in results if 'error' not in r)
+    print(BATCH_DONE_TMPL.format(
+        sep=SEPARATOR,
+        title="DOCKER BATCH ANALYSIS COMPLETE",
+        total=total,
+        successful=successful,
+        failed=len(results) - successful,
+        output_dir=output_dir,
+        summary_file=summary_file,
+    ))
 
     return results
 
@@ -254,6 +528,9 @@ if __name__ == "__main__":
     parser.add_argument("--ml-method", default="mediancut", choices=["mediancut", "kmeans"], help="ML method")
     parser.add_argument("--docker", action="store_true", help="Use Docker for analysis")
     parser.add_argument("--docker-image", default="hse-contrast-checker", help="Docker image name")
+    parser.add_argument(
+        "--skip-existing", action="store_true", help="Skip slides whose result is newer than the slide JSON"
+    )
 
     args = parser.parse_args()
 
@@ -263,20 +540,27 @@ if __name__ == "__main__":
                 args.slides_dir,
                 args.output_dir,
                 args.ml_method,
-                args.docker_image
+                args.docker_image,
+                skip_existing=args.skip_existing
             )
         else:
             results = analyze_slide_batch(
                 args.slides_dir,
                 args.output_dir,
-                args.ml_method
+                args.ml_method,
+                skip_existing=args.skip_existing
             )
 
         # Print final summary
         if results:
-            total_entities = sum(r.get('summary', {}).get('total_entities', 0) for r in results if 'error' not in r)
-            passed_aa = sum(r.get('summary', {}).get('passed_AA_normal', 0) for r in results if 'error' not in r)
-            failed_aa = sum(r.get('summary', {}).get('failed_AA_normal', 0) for r in results if 'error' not in r)
+            total_entities = passed_aa = failed_aa = 0
+            for r in results:
+                if 'error' in r:
+                    continue
+                summary = r.get('summary', {})
+                total_entities += summary.get('total_entities', 0)
+                passed_aa += summary.get('passed_AA_normal', 0)
+                failed_aa += summary.get('failed_AA_normal', 0)
 
             print(f"\nACROSS ALL SLIDES:")
             print(f"  Total text entities: {total_entities}")
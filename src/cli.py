@@ -9,8 +9,83 @@ from src.contrast_checker import analyze_slide
 from src.report_generator import generate_html_report
 
 
+def _analyze_to_files(slide_json, slide_index, bg_image, ml_method, k_colors, out_json, out_html):
+    """
+    Analyze a slide and save its JSON result and HTML report.
+
+    Returns:
+        Tuple of (analysis result, JSON path, HTML path)
+    """
+    result = analyze_slide(
+        slide_json_path=slide_json,
+        slide_index=slide_index,
+        bg_image_path=bg_image,
+        ml_method=ml_method,
+        k_colors=k_colors,
+    )
+
+    # Save JSON result
+    out_json_path = Path(out_json)
+    out_json_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(out_json_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    # Generate HTML report
+    out_html_path = Path(out_html)
+    out_html_path.parent.mkdir(parents=True, exist_ok=True)
+
+    generate_html_report(result, str(out_html_path))
+
+    return result, out_json_path, out_html_path
+
+
+def serve(ml_method, k_colors, out_json, out_html, verbose):
+    """
+    Analyze slides requested as NDJSON lines on stdin, answering with one NDJSON line per request.
+
+    Each request is an object with "slide_json" and optionally "slide_index", "bg_image",
+    "ml_method", "k_colors", "out_json" and "out_html" (defaults come from the command line
+    options). The response echoes "slide_json" and has either "slide_id", "summary",
+    "out_json" and "out_html", or "error".
+    """
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        slide_json = None
+        try:
+            request = json.loads(line)
+            slide_json = request["slide_json"]
+            result, out_json_path, out_html_path = _analyze_to_files(
+                slide_json,
+                request.get("slide_index"),
+                request.get("bg_image"),
+                request.get("ml_method", ml_method),
+                request.get("k_colors", k_colors),
+                request.get("out_json", out_json),
+                request.get("out_html", out_html),
+            )
+            response = {
+                "slide_json": slide_json,
+                "slide_id": result["slide_id"],
+                "summary": result["summary"],
+                "out_json": str(out_json_path),
+                "out_html": str(out_html_path),
+            }
+        except Exception as e:
+            if verbose:
+                import traceback
+
+                traceback.print_exc()
+            response = {"slide_json": slide_json, "error": str(e)}
+
+        sys.stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+
 @click.command()
-@click.option("--slide-json", required=True, type=click.Path(exists=True), help="Path to slide JSON file")
+@click.option("--slide-json", type=click.Path(exists=True), default=None, help="Path to slide JSON file")
 @click.option("--slide-index", type=int, default=None, help="If JSON is array, index of slide to analyze (default: 0)")
 @click.option("--bg-image", type=click.Path(exists=True), default=None, help="Optional background image file")
 @click.option(
@@ -33,7 +108,13 @@ from src.report_generator import generate_html_report
     help="Output HTML report path (default: output/report.html)",
 )
 @click.option("--verbose", is_flag=True, help="Enable verbose logging")
-def main(slide_json, slide_index, bg_image, ml_method, k_colors, out_json, out_html, verbose):
+@click.option(
+    "--serve",
+    "serve_mode",
+    is_flag=True,
+    help="Read slide requests as NDJSON from stdin and write one NDJSON result line per slide",
+)
+def main(slide_json, slide_index, bg_image, ml_method, k_colors, out_json, out_html, verbose, serve_mode):
     """
     HSE ML Contrast Checker - Analyze text/background contrast using ML.
 
@@ -56,7 +137,18 @@ def main(slide_json, slide_index, bg_image, ml_method, k_colors, out_json, out_h
         # Custom output paths
         python -m src.cli --slide-json examples/slide_complex.json \\
             --out-json results/my_result.json --out-html results/my_report.html
+
+    \b
+        # Keep one process running and analyze slides requested on stdin
+        echo '{"slide_json": "examples/slide_color_bg.json"}' | python -m src.cli --serve
     """
+    if serve_mode:
+        serve(ml_method, k_colors, out_json, out_html, verbose)
+        return
+
+    if slide_json is None:
+        raise click.UsageError("Missing option '--slide-json'.")
+
     try:
         if verbose:
             click.echo(f"Loading slide from: {slide_json}")
@@ -68,51 +160,36 @@ def main(slide_json, slide_index, bg_image, ml_method, k_colors, out_json, out_h
         if verbose:
             click.echo("Analyzing contrast...")
 
-        result = analyze_slide(
-            slide_json_path=slide_json,
-            slide_index=slide_index,
-            bg_image_path=bg_image,
-            ml_method=ml_method,
-            k_colors=k_colors,
+        result, out_json_path, out_html_path = _analyze_to_files(
+            slide_json, slide_index, bg_image, ml_method, k_colors, out_json, out_html
         )
 
-        # Save JSON result
-        out_json_path = Path(out_json)
-        out_json_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(out_json_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-
         if verbose:
             click.echo(f"JSON saved to: {out_json_path}")
-
-        # Generate HTML report
-        out_html_path = Path(out_html)
-        out_html_path.parent.mkdir(parents=True, exist_ok=True)
-
-        generate_html_report(result, str(out_html_path))
-
-        if verbose:
             click.echo(f"HTML report saved to: {out_html_path}")
 
         # Print summary
+        summary = result["summary"]
+        failed = summary["failed_AA_normal"]
         click.echo()
         click.secho("Analysis complete!", fg="green", bold=True)
-        click.echo(f"  Slide ID: {result['slide_id']}")
-        click.echo(f"  Total entities: {result['summary']['total_entities']}")
-        click.echo(f"  Passed AA Normal: {result['summary']['passed_AA_normal']}")
-        click.echo(f"  Failed AA Normal: {result['summary']['failed_AA_normal']}")
-        click.echo()
-        click.echo(f"  JSON: {out_json_path}")
-        click.echo(f"  HTML: {out_html_path}")
+        click.echo(
+            "  Slide ID: %s\n  Total entities: %d\n  Passed AA Normal: %d\n  Failed AA Normal: %d\n\n"
+            "  JSON: %s\n  HTML: %s"
+            % (
+                result["slide_id"],
+                summary["total_entities"],
+                summary["passed_AA_normal"],
+                failed,
+                out_json_path,
+                out_html_path,
+            )
+        )
 
         # Exit code based on WCAG compliance
-        if result["summary"]["failed_AA_normal"] > 0:
+        if failed > 0:
             click.echo()
-            click.secho(
-                f"Warning: {result['summary']['failed_AA_normal']} entity(ies) failed WCAG AA Normal standard",
-                fg="yellow",
-            )
+            click.secho(f"Warning: {failed} entity(ies) failed WCAG AA Normal standard", fg="yellow")
             sys.exit(1)
 
     except FileNotFoundError as e:
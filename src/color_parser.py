@@ -2,13 +2,22 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Optional, Dict
+
 from .color_parser_constants import UNIT_PX, UNIT_PT, UNIT_EM, UNIT_REM, PT_TO_PX, EM_BASE_PX, NAMED_COLORS
 
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_RGB_RE = re.compile(r"rgba?\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+))?\s*\)")
+_HSL_RE = re.compile(r"hsla?\s*\(\s*([\d.]+)\s*,\s*([\d.]+)%\s*,\s*([\d.]+)%\s*(?:,\s*([\d.]+))?\s*\)")
+
+# Pixels per font-size unit: 1pt = 1.333px, em/rem assume a 16px base
+_FONT_SIZE_UNIT_PX = {UNIT_PX: 1.0, UNIT_PT: PT_TO_PX, UNIT_EM: EM_BASE_PX}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RGBA:
-    """RGBA color representation."""
+    """RGBA color representation (immutable, so parsed colors can be shared)."""
 
     r: int  # 0-255
     g: int  # 0-255
@@ -26,6 +35,7 @@ class RGBA:
         return f"rgb({self.r}, {self.g}, {self.b})"
 
 
+@lru_cache(maxsize=4096)
 def convert_hsl_to_rgb(h: float, s: float, l: float) -> Tuple[int, int, int]:
     """
     Convert HSL to RGB.
@@ -90,6 +100,12 @@ def parse_color_from_css(color: str) -> RGBA:
     Raises:
         ValueError: If color format is not recognized
     """
+    return _parse_color_cached(color)
+
+
+@lru_cache(maxsize=1024)
+def _parse_color_cached(color: str) -> RGBA:
+    """RGBA of a CSS color string; slides reuse a handful of color strings."""
     color = color.strip().lower()
 
     if color in NAMED_COLORS:
@@ -98,28 +114,27 @@ def parse_color_from_css(color: str) -> RGBA:
     # Hex format
     if color.startswith("#"):
         hex_color = color[1:]
+        n_digits = len(hex_color)
+
+        if n_digits in (3, 6, 8):
+            # int() would also accept "0x", "_" and signs, which are not valid CSS
+            if not _HEX_DIGITS.issuperset(hex_color):
+                raise ValueError(f"Invalid hex color: {color}")
+            value = int(hex_color, 16)
+
+            # #RRGGBB (most common first)
+            if n_digits == 6:
+                return RGBA((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF, 1.0)
+
+            # #RGB: each digit doubled, i.e. 0xXX == 17 * 0xX
+            if n_digits == 3:
+                return RGBA(((value >> 8) & 0xF) * 17, ((value >> 4) & 0xF) * 17, (value & 0xF) * 17, 1.0)
 
-        # #RGB -> #RRGGBB
-        if len(hex_color) == 3:
-            hex_color = "".join([c * 2 for c in hex_color])
-
-        # #RRGGBB
-        if len(hex_color) == 6:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return RGBA(r, g, b, 1.0)
-
-        # #RRGGBBAA
-        if len(hex_color) == 8:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            a = int(hex_color[6:8], 16) / 255.0
-            return RGBA(r, g, b, a)
+            # #RRGGBBAA
+            return RGBA((value >> 24) & 0xFF, (value >> 16) & 0xFF, (value >> 8) & 0xFF, (value & 0xFF) / 255.0)
 
     # rgb/rgba format
-    rgb_match = re.match(r"rgba?\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+))?\s*\)", color)
+    rgb_match = _RGB_RE.match(color)
     if rgb_match:
         r = int(rgb_match.group(1))
         g = int(rgb_match.group(2))
@@ -128,7 +143,7 @@ def parse_color_from_css(color: str) -> RGBA:
         return RGBA(r, g, b, a)
 
     # hsl/hsla format
-    hsl_match = re.match(r"hsla?\s*\(\s*([\d.]+)\s*,\s*([\d.]+)%\s*,\s*([\d.]+)%\s*(?:,\s*([\d.]+))?\s*\)", color)
+    hsl_match = _HSL_RE.match(color)
     if hsl_match:
         h = float(hsl_match.group(1))
         s = float(hsl_match.group(2))
@@ -174,10 +189,17 @@ def parse_style(style_str: str) -> Dict[str, str]:
     Returns:
         Dictionary of style properties
     """
-    style_dict: Dict[str, str] = {}
-
     if not style_str:
-        return style_dict
+        return {}
+
+    # Fresh dict per call: callers may modify it, the cached items are shared
+    return dict(_parse_style_cached(style_str.strip()))
+
+
+@lru_cache(maxsize=8192)
+def _parse_style_cached(style_str: str) -> Tuple[Tuple[str, str], ...]:
+    """Style declarations as (property, value) pairs; templated spans repeat the same style strings."""
+    style_dict: Dict[str, str] = {}
 
     # Split by semicolon
     declarations = style_str.split(";")
@@ -193,7 +215,7 @@ def parse_style(style_str: str) -> Dict[str, str]:
 
         style_dict[prop] = value
 
-    return style_dict
+    return tuple(style_dict.items())
 
 
 def parse_font_size_px(font_size: str) -> Optional[float]:
@@ -208,32 +230,25 @@ def parse_font_size_px(font_size: str) -> Optional[float]:
     Returns:
         Font size in pixels, or None if parsing fails
     """
-    font_size = font_size.strip().lower()
-
-    # px
-    if font_size.endswith(UNIT_PX):
-        try:
-            return float(font_size[:-2])
-        except ValueError:
-            return None
-
-    # pt (1pt = 1.333px)
-    if font_size.endswith(UNIT_PT):
-        try:
-            return float(font_size[:-2]) * PT_TO_PX
-        except ValueError:
-            return None
-
-    # em/rem (assume 16px base)
-    if font_size.endswith(UNIT_EM) or font_size.endswith(UNIT_REM):
-        try:
-            return float(font_size[: -len(UNIT_EM)]) * EM_BASE_PX
-        except ValueError:
-            return None
-
-    # Try as raw number (assume px)
+    return _parse_font_size_cached(font_size.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _parse_font_size_cached(font_size: str) -> Optional[float]:
+    """Font size in pixels of a normalized font-size string, or None."""
+    # Dispatch on the two-character unit suffix ("rem" shares the "em" entry)
+    scale = _FONT_SIZE_UNIT_PX.get(font_size[-2:])
+    if scale is None:
+        # Try as raw number (assume px)
+        number = font_size
+        scale = 1.0
+    elif font_size.endswith(UNIT_REM):
+        number = font_size[: -len(UNIT_REM)]
+    else:
+        number = font_size[:-2]
+
     try:
-        return float(font_size)
+        return float(number) * scale
     except ValueError:
         return None
 
@@ -1,4 +1,5 @@
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 # === Constants ==============================================================
 # Supported CSS units and conversion ratios for font-size parsing.
@@ -12,17 +13,19 @@ PT_TO_PX = 1.333  # 1pt = 1.333px
 EM_BASE_PX = 16.0  # 1em = 16px default browser base
 
 # === Named colors ===========================================================
-# Basic CSS color keywords (can be extended)
-NAMED_COLORS: Dict[str, str] = {
-    "white": "#ffffff",
-    "black": "#000000",
-    "red": "#ff0000",
-    "green": "#008000",
-    "blue": "#0000ff",
-    "yellow": "#ffff00",
-    "cyan": "#00ffff",
-    "magenta": "#ff00ff",
-    "gray": "#808080",
-    "grey": "#808080",
-    "transparent": "#00000000",
-}
+# Basic CSS color keywords (extend this table, not at runtime: parsed colors are cached)
+NAMED_COLORS: Mapping[str, str] = MappingProxyType(
+    {
+        "white": "#ffffff",
+        "black": "#000000",
+        "red": "#ff0000",
+        "green": "#008000",
+        "blue": "#0000ff",
+        "yellow": "#ffff00",
+        "cyan": "#00ffff",
+        "magenta": "#ff00ff",
+        "gray": "#808080",
+        "grey": "#808080",
+        "transparent": "#00000000",
+    }
+)
@@ -5,11 +5,26 @@ from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
 from PIL import Image
 
-from src.color_parser import parse_color_from_css, blend_over, parse_style, RGBA
+from src.color_parser import parse_color_from_css, blend_over, parse_style, parse_font_size_px, RGBA
 from src.html_parser import extract_entities, extract_font_info, extract_geometry
-from src.image_analyzer import analyze_image_region, get_dominant_color_simple
+from src.image_analyzer import analyze_image_region, get_dominant_color_simple, load_image
 from src.wcag import compute_contrast_ratio, classify_contrast_level, suggest_contrast_fixes
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load_slide_json(path: str) -> Any:
+    """Load a slide JSON file, with orjson when it is installed (its decode error is a ValueError too)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 
 def analyze_text_colors(spans_data: List[Dict], default_color: str) -> List[Tuple[Tuple[int, int, int], str, float]]:
     """
@@ -26,34 +41,32 @@ def analyze_text_colors(spans_data: List[Dict], default_color: str) -> List[Tupl
         rgba = parse_color_from_css(default_color)
         return [(rgba.to_rgb_tuple(), default_color, 1.0)]
 
-    weighted_colors = []
+    styles = [parse_style(span.get("style", "")) for span in spans_data]
 
-    for span in spans_data:
-        style = parse_style(span.get("style", ""))
+    # All spans share one color (the common case): it carries the whole weight
+    color_strings = {style.get("color", default_color) for style in styles}
+    if len(color_strings) == 1:
+        color_css = color_strings.pop()
+        return [(parse_color_from_css(color_css).to_rgb_tuple(), color_css, 1.0)]
 
+    weighted_colors = []
+    total_weight = 0.0
+
+    for span, style in zip(spans_data, styles):
         # Extract color
         color_css = style.get("color", default_color)
         rgba = parse_color_from_css(color_css)
 
         # Extract font size (for weighting)
-        font_size_str = style.get("font-size", "16px")
-        try:
-            from src.color_parser import parse_font_size_px
-
-            font_size = parse_font_size_px(font_size_str) or 16.0
-        except:
-            font_size = 16.0
-
-        # Text length
-        text_len = len(span.get("text", ""))
+        font_size = parse_font_size_px(style.get("font-size", "16px")) or 16.0
 
         # Weight = visual area (font_size × text_length)
-        weight = font_size * text_len
+        weight = font_size * len(span.get("text", ""))
+        total_weight += weight
 
         weighted_colors.append((rgba.to_rgb_tuple(), color_css, weight))
 
     # Normalize weights
-    total_weight = sum(w for _, _, w in weighted_colors)
     if total_weight > 0:
         weighted_colors = [(rgb, css, w / total_weight) for rgb, css, w in weighted_colors]
 
@@ -132,10 +145,10 @@ def analyze_entity_contrast(
 
         contrasts.append({"rgb": rgb, "css": css, "weight": weight, "ratio": round(ratio, 2), "wcag": wcag})
 
-    # Find minimum ratio (worst case)
-    ratios: List[float] = [float(c["ratio"]) for c in contrasts]
-    min_ratio = min(ratios)
-    min_contrast = next(c for c in contrasts if c["ratio"] == min_ratio)
+    # Find minimum ratio (worst case) in a single pass
+    min_contrast = min(contrasts, key=lambda c: c["ratio"])
+    min_ratio: float = min_contrast["ratio"]  # type: ignore
+    max_ratio: float = max(c["ratio"] for c in contrasts)  # type: ignore
 
     # Overall WCAG classification (based on worst case)
     overall_wcag: Dict[str, Any] = min_contrast["wcag"]  # type: ignore
@@ -153,7 +166,7 @@ def analyze_entity_contrast(
         "text_colors": [{"rgb": c["rgb"], "css": c["css"], "weight": c["weight"]} for c in contrasts],
         "contrast": {
             "min_ratio": min_ratio,
-            "max_ratio": round(max(ratios), 2),
+            "max_ratio": max_ratio,
             "wcag": overall_wcag,
             "contrasts": contrasts,
         },
@@ -163,11 +176,12 @@ def analyze_entity_contrast(
 
 
 def analyze_slide(
-    slide_json_path: str,
+    slide_json_path: Optional[str] = None,
     slide_index: Optional[int] = None,
     bg_image_path: Optional[str] = None,
     ml_method: str = "mediancut",
     k_colors: int = 5,
+    slide_data: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Analyze contrast for a slide.
@@ -178,38 +192,47 @@ def analyze_slide(
         bg_image_path: Optional path to background image
         ml_method: 'mediancut' or 'kmeans'
         k_colors: Number of dominant colors to extract
+        slide_data: Already loaded slide dictionary; used instead of slide_json_path
+            (e.g. slides returned by the scraper, without a JSON round-trip through disk)
 
     Returns:
         Analysis results dictionary
 
     Raises:
         FileNotFoundError: If files not found
-        ValueError: If JSON is invalid
+        ValueError: If JSON is invalid or no slide source is given
     """
-    # Load slide JSON
-    with open(slide_json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    # Handle array vs single object
-    if isinstance(data, list):
-        if slide_index is not None:
-            slide_data = data[slide_index]
+    if slide_data is None:
+        if slide_json_path is None:
+            raise ValueError("Either slide_json_path or slide_data must be provided")
+
+        # Load slide JSON
+        data = _load_slide_json(slide_json_path)
+
+        # Handle array vs single object
+        if isinstance(data, list):
+            if slide_index is not None:
+                slide_data = data[slide_index]
+            else:
+                slide_data = data[0]
         else:
-            slide_data = data[0]
-    else:
-        slide_data = data
+            slide_data = data
 
-    # Load background image if provided
+    # Load background image if provided and actually needed (base_color takes priority);
+    # a missing file is still an error even when the decode is skipped
     bg_image = None
     if bg_image_path:
-        bg_image = Image.open(bg_image_path).convert("RGB")
+        if not Path(bg_image_path).exists():
+            raise FileNotFoundError(f"Background image not found: {bg_image_path}")
+        if not slide_data.get("base_color"):
+            bg_image = load_image(bg_image_path)
 
     # Determine effective background
     effective_bg, bg_source, bg_details = determine_effective_background(slide_data, bg_image, ml_method, k_colors)
 
     # Extract entities from HTML
     content_html = slide_data.get("content_html", "")
-    entities = extract_entities(content_html)
+    entities = extract_entities(content_html, include_raw_html=False)
 
     # Analyze each entity
     entity_results = []
@@ -1,14 +1,32 @@
-"""HTML Parser for extracting text entities using BeautifulSoup."""
+"""HTML Parser for extracting text entities using lxml."""
 
 import re
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from src.color_parser import parse_style, parse_font_size_px
+from src.wcag import is_large_text
 
+# Compiled once: the id/class filtering runs inside libxml2 instead of Python regexes
+_TEXT_DIV_XPATH = etree.XPath("//div[starts-with(@id, 'text-')]")
+_WRAPPER_XPATH = etree.XPath("(.//*[contains(@class, 'wrapper')])[1]")  # also matches "entity__wrapper"
+_SPAN_XPATH = etree.XPath(".//span")
+# Text nodes only (comments excluded); script/style bodies are code and <template>
+# content is never rendered, so neither is visible text
+_TEXT_XPATH = etree.XPath(
+    ".//text()[not(parent::script or parent::style or ancestor::template)]", smart_strings=False
+)
 
-def extract_entities(content_html: str) -> List[Dict[str, Any]]:
+# lxml refuses str input that declares an encoding; the declaration means nothing for HTML
+_XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+_GEOMETRY_PROPS = ("width", "height", "top", "left")
+_TRANSLATE_RE = re.compile(r"translate\s*\(\s*([\d.-]+)px\s*,\s*([\d.-]+)px\s*\)")
+
+
+def extract_entities(content_html: str, include_raw_html: bool = True) -> List[Dict[str, Any]]:
     """
-    Extract all text entities from HTML using BeautifulSoup.
+    Extract all text entities from HTML using lxml.
 
     This function parses HTML content and extracts all <div> elements with
     id starting with "text-". It collects wrapper styles, span styles, and
@@ -16,6 +34,7 @@ def extract_entities(content_html: str) -> List[Dict[str, Any]]:
 
     Args:
         content_html: HTML content string
+        include_raw_html: Serialize each entity's HTML into raw_html (the analysis itself never reads it)
 
     Returns:
         List of dictionaries with entity data:
@@ -23,7 +42,7 @@ def extract_entities(content_html: str) -> List[Dict[str, Any]]:
         - wrapper_style: Wrapper element style string
         - spans: List of span data (style, text)
         - text_content: Full text content
-        - raw_html: Raw HTML of the entity
+        - raw_html: Raw HTML of the entity (None if include_raw_html is False)
 
     Example:
         >>> html = '<div id="text-123"><span style="color: red;">Hello</span></div>'
@@ -35,24 +54,25 @@ def extract_entities(content_html: str) -> List[Dict[str, Any]]:
         return []
 
     try:
-        soup = BeautifulSoup(content_html, "lxml")
-    except Exception:
+        tree = lxml_html.document_fromstring(_XML_DECLARATION_RE.sub("", content_html, count=1))
+    except etree.ParserError:
+        # Nothing but comments / declarations: no elements at all
         return []
 
     entities = []
 
     # Find all divs with id starting with "text-"
-    for div in soup.find_all("div", id=re.compile(r"^text-")):
+    for div in _TEXT_DIV_XPATH(tree):
         entity_id = _extract_entity_id(div)
         if not entity_id:
             continue
 
         # Find wrapper with geometry (class contains "entity__wrapper" or "wrapper")
-        wrapper = div.find(class_=re.compile(r"(entity__wrapper|wrapper)"))
-        wrapper_style = wrapper.get("style", "") if wrapper else ""
+        wrapper = _WRAPPER_XPATH(div)
+        wrapper_style = wrapper[0].get("style", "") if wrapper else ""
 
         # Collect all spans with their styles and text
-        spans = div.find_all("span")
+        spans = _SPAN_XPATH(div)
         spans_data = []
 
         for span in spans:
@@ -61,7 +81,7 @@ def extract_entities(content_html: str) -> List[Dict[str, Any]]:
                 spans_data.append(span_data)
 
         # Extract all text for weighting
-        text_content = div.get_text(strip=True)
+        text_content = "".join(text.strip() for text in _TEXT_XPATH(div))
 
         entities.append(
             {
@@ -69,7 +89,9 @@ def extract_entities(content_html: str) -> List[Dict[str, Any]]:
                 "wrapper_style": wrapper_style,
                 "spans": spans_data,
                 "text_content": text_content,
-                "raw_html": str(div),
+                "raw_html": (
+                    lxml_html.tostring(div, encoding="unicode", with_tail=False) if include_raw_html else None
+                ),
             }
         )
 
@@ -81,7 +103,7 @@ def _extract_entity_id(div) -> Optional[str]:
     Safely extract entity ID from div element.
     
     Args:
-        div: BeautifulSoup div element
+        div: lxml div element
         
     Returns:
         Entity ID string or None if not found
@@ -100,14 +122,14 @@ def _extract_span_data(span) -> Optional[Dict[str, Any]]:
     Safely extract data from span element with color fallback.
     
     Args:
-        span: BeautifulSoup span element
+        span: lxml span element
         
     Returns:
         Dictionary with style, text, and color or None if span is empty
     """
     try:
         span_style = span.get("style", "")
-        span_text = span.get_text(strip=False)
+        span_text = "".join(_TEXT_XPATH(span))
         
         # Skip empty spans
         if not span_style and not span_text:
@@ -201,18 +223,8 @@ def extract_font_info(
     # Get font weight
     font_weight = wrapper_style.get("font-weight") or first_span_style.get("font-weight") or default_weight
 
-    # WCAG "large text" definition:
-    # - 18pt (24px) and larger
-    # - 14pt (18.67px) and larger if bold (weight >= 700)
-    is_large = False
-    if size_px >= 24:
-        is_large = True
-    elif size_px >= 18.67:
-        # Check if bold
-        if font_weight == "bold" or font_weight == "bolder":
-            is_large = True
-        elif isinstance(font_weight, str) and font_weight.isdigit() and int(font_weight) >= 700:
-            is_large = True
+    # WCAG "large text" definition
+    is_large = is_large_text(size_px, font_weight)
 
     return {"size_px": round(size_px, 2), "weight": font_weight, "is_large": is_large}
 
@@ -238,33 +250,14 @@ def extract_geometry(entity: Dict[str, Any]) -> Dict[str, Any]:
 
     geometry = {}
 
-    # Parse dimensions
-    if "width" in wrapper_style:
-        width_str = wrapper_style["width"].replace("px", "").strip()
-        try:
-            geometry["width"] = float(width_str)
-        except (ValueError, TypeError):
-            pass
-
-    if "height" in wrapper_style:
-        height_str = wrapper_style["height"].replace("px", "").strip()
-        try:
-            geometry["height"] = float(height_str)
-        except (ValueError, TypeError):
-            pass
-
-    # Parse position (top, left)
-    if "top" in wrapper_style:
-        top_str = wrapper_style["top"].replace("px", "").strip()
-        try:
-            geometry["top"] = float(top_str)
-        except (ValueError, TypeError):
-            pass
-
-    if "left" in wrapper_style:
-        left_str = wrapper_style["left"].replace("px", "").strip()
+    # Parse dimensions and position (width, height, top, left)
+    for prop in _GEOMETRY_PROPS:
+        value = wrapper_style.get(prop)
+        if value is None:
+            continue
         try:
-            geometry["left"] = float(left_str)
+            # float() ignores surrounding whitespace itself
+            geometry[prop] = float(value.replace("px", ""))
         except (ValueError, TypeError):
             pass
 
@@ -272,7 +265,7 @@ def extract_geometry(entity: Dict[str, Any]) -> Dict[str, Any]:
     if "transform" in wrapper_style:
         transform = wrapper_style["transform"]
         # Extract translate(x, y)
-        translate_match = re.search(r"translate\s*\(\s*([\d.-]+)px\s*,\s*([\d.-]+)px\s*\)", transform)
+        translate_match = _TRANSLATE_RE.search(transform)
         if translate_match:
             try:
                 geometry["translate_x"] = float(translate_match.group(1))
@@ -5,15 +5,93 @@ Implements two unsupervised learning methods:
 2. K-means clustering (via scikit-learn)
 """
 
+import os
+from functools import lru_cache
 from typing import List, Tuple, Optional
-from PIL import Image
+from PIL import Image, ImageStat
 import numpy as np
-from sklearn.cluster import KMeans
 
 
 # Default fallback color (neutral gray)
 DEFAULT_COLOR = (128, 128, 128)
 
+# Maximum number of pixels fed to K-means (random subsample above this)
+KMEANS_MAX_SAMPLES = 10000
+
+# Background images are analyzed at <=150px, so larger decodes are wasted work
+LOAD_MAX_DIM = 800
+
+# Minimum Otsu separability (between-class / total luminance variance) for k=2 to be
+# treated as two clean luminance modes and skip K-means
+OTSU_MIN_SEPARABILITY = 0.9
+
+# Maximum per-channel RGB standard deviation within each Otsu class: luminance alone
+# cannot tell apart hues of similar brightness (e.g. red and green), whose class mean
+# would be a color that is not in the image
+OTSU_MAX_CLASS_STD = 16.0
+
+# Color spaces K-means can cluster in
+COLOR_SPACES = ("rgb", "lab")
+
+# sRGB (D65) <-> CIE XYZ <-> CIELAB constants
+_SRGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+_XYZ_TO_SRGB = np.linalg.inv(_SRGB_TO_XYZ)
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+_LAB_EPSILON = 216 / 24389
+_LAB_KAPPA = 24389 / 27
+_SRGB_TO_LINEAR = np.where(
+    np.arange(256) / 255.0 <= 0.04045, np.arange(256) / 255.0 / 12.92, ((np.arange(256) / 255.0 + 0.055) / 1.055) ** 2.4
+)
+
+
+def load_image(path: str, max_dim: Optional[int] = LOAD_MAX_DIM) -> Image.Image:
+    """
+    Load an image as RGB, downscaled so neither side exceeds max_dim.
+
+    For JPEG input, draft() lets libjpeg decode directly at a reduced scale
+    instead of decoding the full image and throwing most of it away.
+
+    Decoded images are cached by (path, mtime, size): slides of one
+    presentation usually share a background. The returned image is shared
+    between callers and must be treated as read-only.
+
+    Args:
+        path: Path to image file
+        max_dim: Maximum width/height after loading (None = full resolution)
+
+    Returns:
+        PIL Image in RGB mode
+
+    Example:
+        >>> img = load_image('background.png')
+        >>> max(img.size) <= 800
+        True
+    """
+    stat = os.stat(path)
+    return _load_image_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size, max_dim)
+
+
+@lru_cache(maxsize=8)
+def _load_image_cached(path: str, mtime_ns: int, size: int, max_dim: Optional[int]) -> Image.Image:
+    """Decode image; mtime_ns and size are part of the key so edited files are reloaded."""
+    img = Image.open(path)
+
+    if max_dim:
+        img.draft("RGB", (max_dim, max_dim))
+
+    img = img.convert("RGB")
+
+    if max_dim:
+        img.thumbnail((max_dim, max_dim), Image.Resampling.BILINEAR)
+
+    return img
+
 
 def dominant_colors_mediancut(
     img: Image.Image, bbox: Optional[Tuple[int, int, int, int]] = None, k: int = 5
@@ -50,19 +128,11 @@ def dominant_colors_mediancut(
         if k < 1:
             k = 1
 
-        # Crop region if bbox provided
-        if bbox:
-            region = _safe_crop(img, bbox)
-        else:
-            region = img.copy()
-
-        if region.width == 0 or region.height == 0:
+        # Crop region and convert to RGB
+        region = _prepare_region(img, bbox)
+        if region is None:
             return [(DEFAULT_COLOR, 1.0)]
 
-        # Convert to RGB if needed
-        if region.mode != "RGB":
-            region = region.convert("RGB")
-
         # Resize for performance (max 150x150)
         region = _safe_resize(region, max_size=150)
 
@@ -72,33 +142,26 @@ def dominant_colors_mediancut(
 
         # Get palette and color counts
         palette = pal_img.getpalette()  # [r1, g1, b1, r2, g2, b2, ...]
-        color_counts = pal_img.getcolors()  # [(count1, idx1), (count2, idx2), ...]
-
-        if not color_counts or not palette:
+        if not palette:
             # Fallback: return default color
             return [(DEFAULT_COLOR, 1.0)]
 
-        # Convert to list of ((r, g, b), weight)
-        total_pixels = sum(count for count, _ in color_counts)
+        # Count pixels per palette index in one pass
+        indices = np.asarray(pal_img, dtype=np.uint8).ravel()
+        n_colors = len(palette) // 3
+        counts = np.bincount(indices, minlength=n_colors)[:n_colors]
+
+        total_pixels = int(counts.sum())
         if total_pixels == 0:
             return [(DEFAULT_COLOR, 1.0)]
 
-        result = []
-
-        for count, idx in color_counts:
-            # idx is the palette index (integer)
-            if not isinstance(idx, int) or idx < 0:
-                continue
-            
-            palette_idx = idx * 3
-            if palette_idx + 2 >= len(palette):
-                continue
-
-            r = palette[palette_idx]
-            g = palette[palette_idx + 1]
-            b = palette[palette_idx + 2]
-            weight = count / total_pixels
-            result.append(((int(r), int(g), int(b)), float(weight)))
+        # Convert to list of ((r, g, b), weight)
+        palette_rgb = np.asarray(palette, dtype=np.int64)[: n_colors * 3].reshape(-1, 3)
+        used = np.flatnonzero(counts)
+        result = [
+            (tuple(int(c) for c in palette_rgb[i]), float(counts[i] / total_pixels))
+            for i in used
+        ]
 
         # Sort by weight (descending)
         result.sort(key=lambda x: x[1], reverse=True)
@@ -111,7 +174,11 @@ def dominant_colors_mediancut(
 
 
 def dominant_colors_kmeans(
-    img: Image.Image, bbox: Optional[Tuple[int, int, int, int]] = None, k: int = 5, random_state: int = 42
+    img: Image.Image,
+    bbox: Optional[Tuple[int, int, int, int]] = None,
+    k: int = 5,
+    random_state: int = 42,
+    color_space: str = "rgb",
 ) -> List[Tuple[Tuple[int, int, int], float]]:
     """
     Extract dominant colors using K-means clustering.
@@ -127,17 +194,29 @@ def dominant_colors_kmeans(
         bbox: Optional bounding box (left, top, right, bottom) to crop
         k: Number of clusters (dominant colors)
         random_state: Random seed for reproducibility
+        color_space: 'rgb' or 'lab'. In CIELAB, Euclidean distance follows perceived
+            color difference, so clusters separate visually distinct colors better.
+            Centers are converted back to RGB.
 
     Returns:
         List of tuples: ((r, g, b), weight)
         Sorted by weight (descending)
 
+    Raises:
+        ValueError: If color_space is not supported
+
     Example:
         >>> img = Image.open('background.png')
         >>> colors = dominant_colors_kmeans(img, k=5)
         >>> colors[0]  # Most dominant color
         ((242, 118, 71), 0.38)
     """
+    if color_space not in COLOR_SPACES:
+        raise ValueError(f"Unsupported color space: {color_space} (expected one of {COLOR_SPACES})")
+
+    # Imported here so the median-cut path (CLI default) never pays for loading scikit-learn
+    from sklearn.cluster import KMeans
+
     try:
         # Validate input
         if not isinstance(img, Image.Image):
@@ -146,43 +225,93 @@ def dominant_colors_kmeans(
         if k < 1:
             k = 1
 
-        # Crop region if bbox provided
-        if bbox:
-            region = _safe_crop(img, bbox)
-        else:
-            region = img.copy()
-
-        if region.width == 0 or region.height == 0:
+        # Crop region and convert to RGB
+        region = _prepare_region(img, bbox)
+        if region is None:
             return [(DEFAULT_COLOR, 1.0)]
 
-        # Convert to RGB if needed
-        if region.mode != "RGB":
-            region = region.convert("RGB")
-
         # Resize for performance (150x150)
         region = region.resize((150, 150), Image.Resampling.LANCZOS)
 
-        # Convert to numpy array and reshape to pixels
-        pixels = np.array(region).reshape(-1, 3)
+        # A single cluster's optimal center is the mean color: no iterations needed.
+        # ImageStat derives it from Pillow's per-channel histogram, so no pixel array is built.
+        if k == 1 and color_space == "rgb":
+            return [(tuple(int(c) for c in ImageStat.Stat(region).mean), 1.0)]
+
+        # RGBA pixels viewed as little-endian uint32 give packed 0xAABBGGRR color keys
+        # (alpha is constant) without building a widened copy of the pixel array
+        rgba_pixels = np.asarray(region.convert("RGBA")).reshape(-1, 4)
+        keys = rgba_pixels.view("<u4").ravel()
 
-        if len(pixels) == 0:
+        if len(keys) == 0:
             return [(DEFAULT_COLOR, 1.0)]
 
-        # Check number of unique pixels to avoid issues with KMeans
-        unique_pixels = np.unique(pixels, axis=0)
-        k = min(k, len(unique_pixels))
+        # Count distinct colors (much cheaper than np.unique(axis=0))
+        unique_keys, unique_counts = np.unique(keys, return_counts=True)
+
+        # Few-color regions (flat UI backgrounds): exact colors, no clustering needed
+        if len(unique_keys) <= k:
+            weights = unique_counts / len(keys)
+            result = [
+                ((int(key) & 0xFF, int(key >> 8) & 0xFF, int(key >> 16) & 0xFF), float(weight))
+                for key, weight in zip(unique_keys, weights)
+            ]
+            result.sort(key=lambda x: x[1], reverse=True)
+            return result
+
+        unique_rgb = np.stack([unique_keys & 0xFF, (unique_keys >> 8) & 0xFF, (unique_keys >> 16) & 0xFF], axis=1)
+        unique_features = _rgb_to_lab(unique_rgb) if color_space == "lab" else unique_rgb.astype(np.float32)
+
+        # Two clean luminance modes, each a single tight color (e.g. text over a flat
+        # background): split with Otsu's threshold and take each class mean instead of
+        # fitting K-means
+        if k == 2:
+            luma = (unique_rgb @ np.array([299, 587, 114]) + 500) // 1000
+            threshold, separability = _otsu_split(luma, unique_counts)
+            dark = luma <= threshold
+            if separability >= OTSU_MIN_SEPARABILITY and all(
+                _weighted_rgb_std(unique_rgb[mask], unique_counts[mask]) <= OTSU_MAX_CLASS_STD
+                for mask in (dark, ~dark)
+            ):
+                result = []
+                for mask in (dark, ~dark):
+                    class_counts = unique_counts[mask]
+                    center = (unique_features[mask] * class_counts[:, None]).sum(axis=0) / class_counts.sum()
+                    if color_space == "lab":
+                        rgb = tuple(int(c) for c in _lab_to_rgb(center[None, :])[0])
+                    else:
+                        rgb = tuple(int(c) for c in center)
+                    result.append((rgb, float(class_counts.sum() / len(keys))))
+                result.sort(key=lambda x: x[1], reverse=True)
+                return result
+
+        # Subsample pixels: cluster centers and proportions are stable on ~10k points
+        if len(rgba_pixels) > KMEANS_MAX_SAMPLES:
+            rng = np.random.default_rng(random_state)
+            idx = rng.choice(len(rgba_pixels), KMEANS_MAX_SAMPLES, replace=False)
+            rgba_pixels = rgba_pixels[idx]
+
+        pixels = rgba_pixels[:, :3]
+
+        # Features to cluster on
+        # (float32 input is kept as-is by scikit-learn instead of being upcast to float64)
+        features = _rgb_to_lab(pixels) if color_space == "lab" else pixels.astype(np.float32)
 
         # K-means clustering - this is the ML algorithm
-        kmeans = KMeans(n_clusters=k, random_state=random_state, n_init=10)
-        kmeans.fit(pixels)
+        kmeans = KMeans(n_clusters=k, init="k-means++", random_state=random_state, n_init=3)
+        kmeans.fit(features)
 
-        # Get cluster centers (dominant colors) and labels
-        colors = kmeans.cluster_centers_.astype(int)
-        labels = kmeans.labels_
+        # Get cluster centers (dominant colors)
+        if color_space == "lab":
+            colors = _lab_to_rgb(kmeans.cluster_centers_)
+        else:
+            colors = kmeans.cluster_centers_.astype(int)
 
-        # Calculate weights (proportion of pixels in each cluster)
-        counts = np.bincount(labels)
-        weights = counts / len(labels)
+        # Calculate weights (proportion of pixels in each cluster) over the full region,
+        # not just the sample: assign each distinct color once, weighted by its pixel count
+        labels = kmeans.predict(unique_features)
+        counts = np.bincount(labels, weights=unique_counts, minlength=len(colors))
+        weights = counts / len(keys)
 
         # Build result list
         result = [
@@ -272,6 +401,86 @@ def analyze_image_region(
         return [(DEFAULT_COLOR, 1.0)]
 
 
+def _rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Convert uint8 sRGB colors of shape (N, 3) to CIELAB (D65), float32."""
+    xyz = _SRGB_TO_LINEAR[rgb] @ _SRGB_TO_XYZ.T / _D65_WHITE
+    f = np.where(xyz > _LAB_EPSILON, np.cbrt(xyz), (_LAB_KAPPA * xyz + 16) / 116)
+    lab = np.stack([116 * f[:, 1] - 16, 500 * (f[:, 0] - f[:, 1]), 200 * (f[:, 1] - f[:, 2])], axis=1)
+    return lab.astype(np.float32)
+
+
+def _lab_to_rgb(lab: np.ndarray) -> np.ndarray:
+    """Convert CIELAB (D65) colors of shape (N, 3) back to sRGB ints in 0-255."""
+    fy = (lab[:, 0] + 16) / 116
+    f = np.stack([fy + lab[:, 1] / 500, fy, fy - lab[:, 2] / 200], axis=1)
+    xyz = np.where(f**3 > _LAB_EPSILON, f**3, (116 * f - 16) / _LAB_KAPPA) * _D65_WHITE
+    linear = np.clip(xyz @ _XYZ_TO_SRGB.T, 0.0, 1.0)
+    srgb = np.where(linear <= 0.0031308, 12.92 * linear, 1.055 * linear ** (1 / 2.4) - 0.055)
+    return np.clip(np.rint(srgb * 255), 0, 255).astype(int)
+
+
+def _weighted_rgb_std(rgb: np.ndarray, counts: np.ndarray) -> float:
+    """Largest per-channel standard deviation of colors weighted by their pixel counts."""
+    mean = (rgb * counts[:, None]).sum(axis=0) / counts.sum()
+    variance = (((rgb - mean) ** 2) * counts[:, None]).sum(axis=0) / counts.sum()
+    return float(np.sqrt(variance.max()))
+
+
+def _otsu_split(luma: np.ndarray, counts: np.ndarray) -> Tuple[int, float]:
+    """
+    Otsu threshold over a weighted 8-bit luminance histogram.
+
+    Args:
+        luma: Integer luminance (0-255) per color
+        counts: Pixel count per color
+
+    Returns:
+        Tuple of (threshold, separability); colors with luma <= threshold form the
+        dark class. Separability is the between-class share of the total variance (0-1).
+    """
+    hist = np.bincount(luma, weights=counts, minlength=256)
+    levels = np.arange(256)
+    total = hist.sum()
+    mean = (hist * levels).sum() / total
+    total_var = (hist * (levels - mean) ** 2).sum() / total
+    if total_var == 0:
+        return 0, 0.0
+
+    w0 = np.cumsum(hist) / total
+    m0 = np.cumsum(hist * levels) / total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = (mean * w0 - m0) ** 2 / (w0 * (1 - w0))
+    between[~np.isfinite(between)] = 0.0
+
+    threshold = int(np.argmax(between))
+    return threshold, float(between[threshold] / total_var)
+
+
+def _prepare_region(img: Image.Image, bbox: Optional[Tuple[int, int, int, int]] = None) -> Optional[Image.Image]:
+    """
+    Crop image to bbox and convert to RGB without copying the full image.
+
+    Every later step (crop, convert, resize, quantize) returns a new image,
+    so the caller's image is never modified.
+
+    Args:
+        img: PIL Image object
+        bbox: Optional bounding box (left, top, right, bottom)
+
+    Returns:
+        RGB region, or None if the region is empty
+    """
+    region = _safe_crop(img, bbox) if bbox else img
+
+    if region.width == 0 or region.height == 0:
+        return None
+
+    if region.mode != "RGB":
+        region = region.convert("RGB")
+
+    return region
+
+
 def _safe_crop(img: Image.Image, bbox: Tuple[int, int, int, int]) -> Image.Image:
     """
     Safely crop image with bounds validation.
@@ -4,13 +4,15 @@ Implements contrast ratio calculation and classification according to
 Web Content Accessibility Guidelines (WCAG) 2.2.
 """
 
-from typing import Tuple, Dict, List, Any
-import math
+from functools import lru_cache
+from typing import Tuple, Dict, List, Any, Union
+import numpy as np
 from .wcag_constants import (
     SRGB_GAMMA,
     SRGB_A,
     SRGB_DIV_LOW,
     SRGB_DIV_HIGH,
+    SRGB_THRESHOLD,
     LUMA_R,
     LUMA_G,
     LUMA_B,
@@ -24,7 +26,48 @@ from .wcag_constants import (
 )
 
 
-def compute_relative_luminance(rgb: Tuple[int, int, int]) -> float:
+def _linearize(c: np.ndarray) -> np.ndarray:
+    """Apply the sRGB gamma expansion to channel values in the 0.0-1.0 range."""
+    return np.where(c <= SRGB_THRESHOLD, c / SRGB_DIV_LOW, ((c + SRGB_A) / SRGB_DIV_HIGH) ** SRGB_GAMMA)
+
+
+# Channels are 8-bit, so the gamma expansion has only 256 distinct outputs:
+# precompute them once and replace the per-channel pow() with a table lookup.
+_SRGB_LUT = _linearize(np.arange(256, dtype=np.float64) / 255.0)
+_LUM_COEF = np.array([LUMA_R, LUMA_G, LUMA_B])
+
+# Luma weights folded into per-channel tables: luminance is three lookups and two adds.
+_LUM_R_LUT = LUMA_R * _SRGB_LUT
+_LUM_G_LUT = LUMA_G * _SRGB_LUT
+_LUM_B_LUT = LUMA_B * _SRGB_LUT
+
+# Tables are shared module state: an accidental in-place write would corrupt every later result
+for _table in (
+    _SRGB_LUT,
+    _LUM_COEF,
+    _LUM_R_LUT,
+    _LUM_G_LUT,
+    _LUM_B_LUT,
+):
+    _table.setflags(write=False)
+del _table
+
+
+# Plain-float copies of the contribution tables for scalar lookups (no NumPy scalar overhead)
+_LUM_R_LIST = _LUM_R_LUT.tolist()
+_LUM_G_LIST = _LUM_G_LUT.tolist()
+_LUM_B_LIST = _LUM_B_LUT.tolist()
+
+
+@lru_cache(maxsize=4096)
+def _relative_luminance_cached(r: int, g: int, b: int) -> float:
+    """Relative luminance of a single 8-bit color; slides reuse a handful of colors."""
+    return (
+        _LUM_R_LIST[min(max(r, 0), 255)] + _LUM_G_LIST[min(max(g, 0), 255)] + _LUM_B_LIST[min(max(b, 0), 255)]
+    )
+
+
+def compute_relative_luminance(rgb: Union[Tuple[int, int, int], np.ndarray]) -> Union[float, np.ndarray]:
     """
     Calculate relative luminance of an RGB color.
 
@@ -35,11 +78,15 @@ def compute_relative_luminance(rgb: Tuple[int, int, int]) -> float:
     - If RsRGB <= 0.03928: R = RsRGB / 12.92
     - Else: R = ((RsRGB + 0.055) / 1.055) ^ 2.4
 
+    Integer channels are linearized through a precomputed 256-entry lookup
+    table; float channels fall back to the exact formula. Results for plain
+    (r, g, b) int tuples are memoized.
+
     Args:
-        rgb: RGB tuple (0-255, 0-255, 0-255)
+        rgb: RGB tuple (0-255, 0-255, 0-255) or array of shape (..., 3)
 
     Returns:
-        Relative luminance (0.0-1.0)
+        Relative luminance (0.0-1.0); an array of shape (...) for array input
 
     Example:
         >>> compute_relative_luminance((255, 255, 255))  # White
@@ -47,26 +94,26 @@ def compute_relative_luminance(rgb: Tuple[int, int, int]) -> float:
         >>> compute_relative_luminance((0, 0, 0))  # Black
         0.0
     """
-    r, g, b = rgb
-
-    # Convert to 0.0-1.0 range
-    r_srgb = r / 255.0
-    g_srgb = g / 255.0
-    b_srgb = b / 255.0
+    if isinstance(rgb, tuple) and len(rgb) == 3 and all(type(c) is int for c in rgb):
+        return _relative_luminance_cached(*rgb)
 
-    # Apply gamma correction
-    def _linearize(c: float) -> float:
-        if c <= 0.03928:
-            return c / SRGB_DIV_LOW
-        return math.pow((c + SRGB_A) / SRGB_DIV_HIGH, SRGB_GAMMA)
+    arr = np.asarray(rgb)
 
-    r_linear = _linearize(r_srgb)
-    g_linear = _linearize(g_srgb)
-    b_linear = _linearize(b_srgb)
+    if arr.dtype.kind in "ui":
+        # Gamma correction and luma weights in one table lookup per channel
+        # (uint8 is already in range, so it skips the clipping pass)
+        if arr.dtype != np.uint8:
+            arr = np.clip(arr, 0, 255)
+        luminance = _LUM_R_LUT[arr[..., 0]] + _LUM_G_LUT[arr[..., 1]] + _LUM_B_LUT[arr[..., 2]]
+    else:
+        # Apply gamma correction
+        linear = _linearize(arr / 255.0)
 
-    # Calculate luminance
-    luminance = LUMA_R * r_linear + LUMA_G * g_linear + LUMA_B * b_linear
+        # Calculate luminance
+        luminance = linear @ _LUM_COEF
 
+    if luminance.ndim == 0:
+        return float(luminance)
     return luminance
 
 
@@ -89,16 +136,70 @@ def compute_contrast_ratio(color1: Tuple[int, int, int], color2: Tuple[int, int,
         >>> compute_contrast_ratio((0, 0, 0), (255, 255, 255))  # Black vs White
         21.0
     """
-    lum1 = compute_relative_luminance(color1)
-    lum2 = compute_relative_luminance(color2)
+    # Common case (two 8-bit RGB tuples): straight to the cached scalar lookup.
+    # Anything else (float channels, arrays) fails the table index and takes the general path.
+    try:
+        lum1 = _relative_luminance_cached(*color1)
+        lum2 = _relative_luminance_cached(*color2)
+    except TypeError:
+        lum1 = compute_relative_luminance(color1)
+        lum2 = compute_relative_luminance(color2)
+
+    # Lighter / darker luminance with a single comparison, no swap
+    lighter, darker = (lum1, lum2) if lum1 >= lum2 else (lum2, lum1)
+
+    return (lighter + CONTRAST_K) / (darker + CONTRAST_K)
+
+
+def compute_contrast_ratio_batch(colors1: Any, colors2: Any) -> np.ndarray:
+    """
+    Calculate contrast ratios for many color pairs at once.
+
+    Vectorized counterpart of compute_contrast_ratio: luminances of all
+    colors are looked up in one pass and the ratios computed with NumPy.
+
+    Args:
+        colors1: Array-like of RGB colors, shape (N, 3)
+        colors2: Array-like of RGB colors, shape (N, 3) or a single color (3,)
+
+    Returns:
+        Array of contrast ratios, shape (N,)
+
+    Example:
+        >>> compute_contrast_ratio_batch([(0, 0, 0), (255, 255, 255)], (255, 255, 255))
+        array([21.,  1.])
+    """
+    lum1 = compute_relative_luminance(colors1)
+    lum2 = compute_relative_luminance(colors2)
+
+    lighter = np.maximum(lum1, lum2)
+    darker = np.minimum(lum1, lum2)
+
+    return (lighter + CONTRAST_K) / (darker + CONTRAST_K)
+
+
+def is_large_text(font_size_px: float, font_weight: str) -> bool:
+    """
+    Check whether text qualifies as "large text" per WCAG 2.2.
 
-    # Ensure L1 is lighter
-    if lum1 < lum2:
-        lum1, lum2 = lum2, lum1
+    Large text is 18pt (24px) and larger, or 14pt (18.67px) and larger if
+    bold (weight >= 700).
 
-    ratio = (lum1 + CONTRAST_K) / (lum2 + CONTRAST_K)
+    Args:
+        font_size_px: Font size in pixels
+        font_weight: Font weight ('normal', 'bold', or numeric string)
 
-    return ratio
+    Returns:
+        True if the text is large
+    """
+    if font_size_px >= 24:
+        return True
+    if font_size_px >= 18.67:
+        if font_weight in ("bold", "bolder"):
+            return True
+        if isinstance(font_weight, str) and font_weight.isdigit() and int(font_weight) >= 700:
+            return True
+    return False
 
 
 def classify_contrast_level(ratio: float, font_size_px: float, font_weight: str) -> Dict[str, bool]:
@@ -128,23 +229,10 @@ def classify_contrast_level(ratio: float, font_size_px: float, font_weight: str)
         {'AA_normal': True, 'AA_large': True, 'AAA': False}
     """
     # Determine if large text
-    is_large = False
-    if font_size_px >= 24:
-        is_large = True
-    elif font_size_px >= 18.67:
-        # Check if bold
-        if font_weight in ("bold", "bolder"):
-            is_large = True
-        elif font_weight.isdigit() and int(font_weight) >= 700:
-            is_large = True
-
-    # WCAG thresholds
-    if is_large:
-        aa_threshold = AA_LARGE
-        aaa_threshold = AAA_LARGE
-    else:
-        aa_threshold = AA_NORMAL
-        aaa_threshold = AAA_NORMAL
+    is_large = is_large_text(font_size_px, font_weight)
+
+    # AAA threshold depends on text size; AA is reported for both sizes
+    aaa_threshold = AAA_LARGE if is_large else AAA_NORMAL
 
     return {
         "AA_normal": ratio >= AA_NORMAL,
@@ -193,69 +281,59 @@ def suggest_contrast_fixes(
     suggestions: List[Dict[str, Any]] = []
 
     # Determine target ratio based on current font
-    wcag_class = classify_contrast_level(current_ratio, font_size_px, font_weight)
-    is_large = wcag_class["is_large_text"]
+    is_large = is_large_text(font_size_px, font_weight)
     target_ratio = AA_LARGE if is_large else AA_NORMAL
 
     if current_ratio >= target_ratio:
         return suggestions  # Already passes
 
-    # 1. Invert text color
+    # 1-2. Candidate text colors: inverted, black, white (one batched ratio computation)
     inverted_text = (255 - text_rgb[0], 255 - text_rgb[1], 255 - text_rgb[2])
-    inv_ratio = compute_contrast_ratio(inverted_text, bg_rgb)
-    if inv_ratio >= target_ratio:
-        suggestions.append(
-            {
-                "type": "invert_text_color",
-                "description": "Инвертировать цвет текста",
-                "new_value": f"#{inverted_text[0]:02x}{inverted_text[1]:02x}{inverted_text[2]:02x}",
-                "expected_ratio": round(inv_ratio, 2),
-            }
-        )
-
-    # 2. Change text to black or white
-    for new_text, name in [((0, 0, 0), "black"), ((255, 255, 255), "white")]:
-        new_ratio = compute_contrast_ratio(new_text, bg_rgb)
+    text_candidates = [
+        (inverted_text, "invert_text_color", "Инвертировать цвет текста"),
+        ((0, 0, 0), "change_text_color", "Изменить цвет текста на black"),
+        ((255, 255, 255), "change_text_color", "Изменить цвет текста на white"),
+    ]
+    text_ratios = compute_contrast_ratio_batch([c[0] for c in text_candidates], bg_rgb)
+    for (new_text, fix_type, description), new_ratio in zip(text_candidates, text_ratios):
         if new_ratio >= target_ratio:
             suggestions.append(
                 {
-                    "type": "change_text_color",
-                    "description": f"Изменить цвет текста на {name}",
+                    "type": fix_type,
+                    "description": description,
                     "new_value": f"#{new_text[0]:02x}{new_text[1]:02x}{new_text[2]:02x}",
-                    "expected_ratio": round(new_ratio, 2),
+                    "expected_ratio": round(float(new_ratio), 2),
                 }
             )
 
     # 3. Darken background
-    for factor in DARKEN_FACTORS:
-        darkened_bg = (int(bg_rgb[0] * factor), int(bg_rgb[1] * factor), int(bg_rgb[2] * factor))
-        dark_ratio = compute_contrast_ratio(text_rgb, darkened_bg)
+    # (all scaled candidates at once, saturated to uint8 like CSS clamps channels)
+    bg = np.asarray(bg_rgb, dtype=np.float64)
+    darkened_bgs = np.clip(np.outer(DARKEN_FACTORS, bg), 0, 255).astype(np.uint8)
+    dark_ratios = compute_contrast_ratio_batch(darkened_bgs, text_rgb)
+    for factor, darkened_bg, dark_ratio in zip(DARKEN_FACTORS, darkened_bgs.tolist(), dark_ratios):
         if dark_ratio >= target_ratio:
             suggestions.append(
                 {
                     "type": "darken_background",
                     "description": f"Затемнить фон на {int((1-factor)*100)}%",
                     "new_value": f"rgb({darkened_bg[0]}, {darkened_bg[1]}, {darkened_bg[2]})",
-                    "expected_ratio": round(dark_ratio, 2),
+                    "expected_ratio": round(float(dark_ratio), 2),
                 }
             )
             break
 
     # 4. Lighten background
-    for factor in LIGHTEN_FACTORS:
-        lightened_bg = (
-            min(255, int(bg_rgb[0] * factor)),
-            min(255, int(bg_rgb[1] * factor)),
-            min(255, int(bg_rgb[2] * factor)),
-        )
-        light_ratio = compute_contrast_ratio(text_rgb, lightened_bg)
+    lightened_bgs = np.clip(np.outer(LIGHTEN_FACTORS, bg), 0, 255).astype(np.uint8)
+    light_ratios = compute_contrast_ratio_batch(lightened_bgs, text_rgb)
+    for factor, lightened_bg, light_ratio in zip(LIGHTEN_FACTORS, lightened_bgs.tolist(), light_ratios):
         if light_ratio >= target_ratio:
             suggestions.append(
                 {
                     "type": "lighten_background",
                     "description": f"Осветлить фон на {int((factor-1)*100)}%",
                     "new_value": f"rgb({lightened_bg[0]}, {lightened_bg[1]}, {lightened_bg[2]})",
-                    "expected_ratio": round(light_ratio, 2),
+                    "expected_ratio": round(float(light_ratio), 2),
                 }
             )
             break
@@ -5,6 +5,7 @@ SRGB_GAMMA = 2.4
 SRGB_A = 0.055
 SRGB_DIV_LOW = 12.92
 SRGB_DIV_HIGH = 1.055
+SRGB_THRESHOLD = 0.03928
 
 # === Relative luminance coefficients (D65) ==================================
 LUMA_R = 0.2126
@@ -4,8 +4,9 @@ import os
 import json
 import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 
 from fastapi import FastAPI, HTTPException, Form, UploadFile, File
 from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
@@ -55,6 +56,83 @@ class AnalyzeRequest(BaseModel):
     slide_index: Optional[int] = 1
 
 
+def _analyze_one_slide(
+    display_idx: int, slide_data: Dict[str, Any], session_dir: Path, session_id: str, ml_method: str
+) -> Dict[str, Any]:
+    """
+    Analyze one slide and write its HTML report and JSON result.
+
+    Args:
+        display_idx: 1-based slide number used in output file names
+        slide_data: Slide dictionary as returned by the scraper
+        session_dir: Session output directory
+        session_id: Session ID used in result URLs
+        ml_method: ML method (kmeans or mediancut)
+
+    Returns:
+        Result entry for the API response
+    """
+    # Analyze
+    result = analyze_slide(
+        slide_data=slide_data,
+        ml_method=ml_method,
+        k_colors=5
+    )
+
+    # Generate HTML report
+    report_path = session_dir / f"report_{display_idx:03d}.html"
+    generate_html_report(result, str(report_path))
+
+    # Save JSON result
+    json_path = session_dir / f"result_{display_idx:03d}.json"
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+    return {
+        "slide_id": result["slide_id"],
+        "slide_number": display_idx,
+        "summary": result["summary"],
+        "report_url": f"/results/{session_id}/report_{display_idx:03d}.html",
+        "json_url": f"/results/{session_id}/result_{display_idx:03d}.json"
+    }
+
+
+def _analyze_slides(
+    slides: List[Dict[str, Any]], session_dir: Path, session_id: str, ml_method: str
+) -> List[Dict[str, Any]]:
+    """
+    Analyze slides concurrently.
+
+    Slides are independent, so they run on a thread pool. Only the parts that
+    release the GIL overlap between slides: image decoding and resizing (Pillow),
+    NumPy and scikit-learn color extraction, lxml parsing and file I/O. Style
+    parsing and the per-entity loops are Python code and still run one at a time.
+
+    Args:
+        slides: Slide dictionaries in display order
+        session_dir: Session output directory
+        session_id: Session ID used in result URLs
+        ml_method: ML method (kmeans or mediancut)
+
+    Returns:
+        Result entries in slide order
+    """
+    max_workers = min(len(slides), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return [
+            _analyze_one_slide(idx, slide_data, session_dir, session_id, ml_method)
+            for idx, slide_data in enumerate(slides, 1)
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda item: _analyze_one_slide(item[0], item[1], session_dir, session_id, ml_method),
+                enumerate(slides, 1),
+            )
+        )
+
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the landing page."""
@@ -113,39 +191,8 @@ async def analyze_url(
         if not slides:
             raise HTTPException(status_code=400, detail="Не удалось извлечь слайды")
 
-        # Find all slide JSON files in the directory
-        slides_dir = session_dir / "slides"
-        slide_json_files = sorted(slides_dir.glob("slide_*.json"))
-
-        if not slide_json_files:
-            raise HTTPException(status_code=400, detail="Не удалось найти извлечённые слайды")
-
-        # Analyze each slide
-        results = []
-        for display_idx, slide_json_path in enumerate(slide_json_files, 1):
-            # Analyze
-            result = analyze_slide(
-                slide_json_path=str(slide_json_path),
-                ml_method=ml_method,
-                k_colors=5
-            )
-
-            # Generate HTML report
-            report_path = session_dir / f"report_{display_idx:03d}.html"
-            generate_html_report(result, str(report_path))
-
-            # Save JSON result
-            json_path = session_dir / f"result_{display_idx:03d}.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-
-            results.append({
-                "slide_id": result["slide_id"],
-                "slide_number": display_idx,
-                "summary": result["summary"],
-                "report_url": f"/results/{session_id}/report_{display_idx:03d}.html",
-                "json_url": f"/results/{session_id}/result_{display_idx:03d}.json"
-            })
+        # Analyze slides returned by the scraper (in parallel, results keep slide order)
+        results = _analyze_slides(slides, session_dir, session_id, ml_method)
 
         return JSONResponse({
             "success": True,
@@ -154,6 +201,8 @@ async def analyze_url(
             "results": results
         })
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ошибка анализа: {str(e)}")
 
@@ -205,39 +254,8 @@ async def analyze_file(
         if not slides:
             raise HTTPException(status_code=400, detail="Не удалось извлечь слайды")
 
-        # Find all slide JSON files in the directory
-        slides_dir = session_dir / "slides"
-        slide_json_files = sorted(slides_dir.glob("slide_*.json"))
-
-        if not slide_json_files:
-            raise HTTPException(status_code=400, detail="Не удалось найти извлечённые слайды")
-
-        # Analyze each slide
-        results = []
-        for display_idx, slide_json_path in enumerate(slide_json_files, 1):
-            # Analyze
-            result = analyze_slide(
-                slide_json_path=str(slide_json_path),
-                ml_method=ml_method,
-                k_colors=5
-            )
-
-            # Generate HTML report
-            report_path = session_dir / f"report_{display_idx:03d}.html"
-            generate_html_report(result, str(report_path))
-
-            # Save JSON result
-            json_path = session_dir / f"result_{display_idx:03d}.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-
-            results.append({
-                "slide_id": result["slide_id"],
-                "slide_number": display_idx,
-                "summary": result["summary"],
-                "report_url": f"/results/{session_id}/report_{display_idx:03d}.html",
-                "json_url": f"/results/{session_id}/result_{display_idx:03d}.json"
-            })
+        # Analyze slides returned by the scraper (in parallel, results keep slide order)
+        results = _analyze_slides(slides, session_dir, session_id, ml_method)
 
         return JSONResponse({
             "success": True,
@@ -246,6 +264,8 @@ async def analyze_file(
             "results": results
         })
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ошибка анализа: {str(e)}")
 
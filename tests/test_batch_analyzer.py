@@ -0,0 +1,196 @@
+"""Tests for batch analyzer module."""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from src import batch_analyzer
+from src.batch_analyzer import analyze_slide_batch, analyze_slide_batch_docker
+
+# Stands in for `docker run ... --serve`: answers each NDJSON request with a fixed summary,
+# and never answers for slide_002 (as a stuck container would)
+FAKE_DOCKER = """#!{python}
+import json, sys, time
+for line in sys.stdin:
+    request = json.loads(line)
+    if "slide_002" in request["slide_json"]:
+        time.sleep(60)
+    summary = {{"total_entities": 1, "passed_AA_normal": 1, "failed_AA_normal": 0}}
+    print(json.dumps({{"slide_json": request["slide_json"], "slide_id": "fake", "summary": summary}}), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_docker(temp_dir, monkeypatch):
+    """Put a fake `docker` executable first on PATH."""
+    bin_dir = temp_dir / "bin"
+    bin_dir.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(FAKE_DOCKER.format(python=sys.executable), encoding="utf-8")
+    docker.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_analyze_slide_batch_skips_up_to_date_results(temp_dir, sample_slide_json, monkeypatch):
+    """Test results newer than their slide JSON are reused without running the analysis."""
+    slides_dir = temp_dir / "slides"
+    output_dir = temp_dir / "output"
+    slides_dir.mkdir()
+    output_dir.mkdir()
+
+    slide_file = slides_dir / "slide_001.json"
+    slide_file.write_text(json.dumps(sample_slide_json), encoding="utf-8")
+    result_file = output_dir / "slide_001_result.json"
+    summary = {"total_entities": 3, "passed_AA_normal": 2, "failed_AA_normal": 1}
+    result_file.write_text(json.dumps({"slide_id": "slide-001", "summary": summary}), encoding="utf-8")
+    os.utime(slide_file, (0, 0))
+
+    def fail_analyze(*args, **kwargs):
+        raise AssertionError("analysis should have been skipped")
+
+    monkeypatch.setattr(batch_analyzer, "analyze_slide", fail_analyze)
+
+    results = analyze_slide_batch(str(slides_dir), str(output_dir), skip_existing=True)
+
+    assert len(results) == 1
+    assert results[0]["summary"] == summary
+    assert results[0]["skipped"] is True
+
+
+def test_analyze_slide_batch_writes_results_in_slide_order(temp_dir, sample_slide_json):
+    """Test slides are analyzed in-process and reported in slide order, including failures."""
+    slides_dir = temp_dir / "slides"
+    output_dir = temp_dir / "output"
+    slides_dir.mkdir()
+
+    (slides_dir / "slide_001.json").write_text(json.dumps(sample_slide_json), encoding="utf-8")
+    (slides_dir / "slide_002.json").write_text("not json", encoding="utf-8")
+    (slides_dir / "slide_003.json").mkdir()  # not a slide file
+    (slides_dir / "notes.json").write_text("{}", encoding="utf-8")
+
+    results = analyze_slide_batch(str(slides_dir), str(output_dir), verbose=False)
+
+    assert [r["slide_file"] for r in results] == [
+        str(slides_dir / "slide_001.json"),
+        str(slides_dir / "slide_002.json"),
+    ]
+    assert results[0]["slide_id"] == sample_slide_json["id"]
+    assert results[0]["summary"]["total_entities"] == 2
+    assert (output_dir / "slide_001_result.json").exists()
+    assert (output_dir / "slide_001_report.html").exists()
+    assert "error" in results[1]
+    summary = json.loads((output_dir / "batch_summary.json").read_text(encoding="utf-8"))
+    assert summary == json.loads(json.dumps(results))
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched analyze_slide"
+)
+def test_analyze_slide_batch_times_out_stuck_slide(temp_dir, sample_slide_json, monkeypatch, capsys):
+    """Test a stuck slide is reported as timed out while the other slides are still analyzed."""
+    slides_dir = temp_dir / "slides"
+    slides_dir.mkdir()
+    for i in (1, 2, 3):
+        (slides_dir / f"slide_00{i}.json").write_text(json.dumps(sample_slide_json), encoding="utf-8")
+
+    analyze = batch_analyzer.analyze_slide
+
+    def analyze_or_hang(slide_json_path, **kwargs):
+        if slide_json_path.endswith("slide_002.json"):
+            time.sleep(60)
+        return analyze(slide_json_path=slide_json_path, **kwargs)
+
+    monkeypatch.setattr(batch_analyzer, "analyze_slide", analyze_or_hang)
+
+    results = analyze_slide_batch(str(slides_dir), str(temp_dir / "output"), verbose=False, timeout=2)
+
+    assert [r.get("error") for r in results] == [None, "Analysis timed out", None]
+    assert results[2]["slide_id"] == sample_slide_json["id"]
+    output = capsys.readouterr().out
+    assert "[2/3] Analyzing slide_002.json" in output
+    assert "[TIMEOUT]" in output
+
+
+def test_run_serve_container_collects_every_answer(temp_dir, sample_slide_json, monkeypatch):
+    """Test the serve-mode driver sends every request and hands back every answer."""
+    monkeypatch.chdir(Path(__file__).parent.parent)  # so that `python -m src.cli` resolves
+    slide_path = temp_dir / "slide.json"
+    slide_path.write_text(json.dumps(sample_slide_json), encoding="utf-8")
+    requests = [
+        json.dumps(
+            {
+                "slide_json": str(slide_path),
+                "out_json": str(temp_dir / f"result_{i}.json"),
+                "out_html": str(temp_dir / f"report_{i}.html"),
+            }
+        )
+        + "\n"
+        for i in range(3)
+    ]
+    responses = []
+
+    stderr = asyncio.run(
+        batch_analyzer._run_serve_container([sys.executable, "-m", "src.cli", "--serve"], requests, responses.append)
+    )
+
+    assert stderr == ""
+    assert [r["out_json"] for r in responses] == [str(temp_dir / f"result_{i}.json") for i in range(3)]
+    assert all(r["slide_id"] == sample_slide_json["id"] for r in responses)
+
+
+def test_run_serve_container_stops_stuck_command(temp_dir):
+    """Test a command that stops answering is stopped before the timeout is reported."""
+    pid_file = temp_dir / "pid"
+    script = "import os, sys, time; open(sys.argv[1], 'w').write(str(os.getpid())); time.sleep(60)"
+    cmd = [sys.executable, "-c", script, str(pid_file)]
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(batch_analyzer._run_serve_container(cmd, ["{}\n"], lambda response: None, timeout=1))
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
+
+
+def test_analyze_slide_batch_missing_dir(temp_dir):
+    """Test a missing slides directory is reported."""
+    with pytest.raises(FileNotFoundError):
+        analyze_slide_batch(str(temp_dir / "missing"), str(temp_dir / "output"))
+
+
+def test_analyze_slide_batch_docker_keeps_slide_order(temp_dir, sample_slide_json, fake_docker):
+    """Test skipped and container-analyzed slides are summarized in slide order."""
+    slides_dir = temp_dir / "slides"
+    output_dir = temp_dir / "output"
+    slides_dir.mkdir()
+    output_dir.mkdir()
+    for i in (1, 3):
+        (slides_dir / f"slide_00{i}.json").write_text(json.dumps(sample_slide_json), encoding="utf-8")
+    result_file = output_dir / "slide_003_result.json"
+    result_file.write_text(json.dumps({"slide_id": "slide-003", "summary": {}}), encoding="utf-8")
+    os.utime(slides_dir / "slide_003.json", (0, 0))
+
+    results = analyze_slide_batch_docker(str(slides_dir), str(output_dir), skip_existing=True)
+
+    assert [Path(r["slide_file"]).name for r in results] == ["slide_001.json", "slide_003.json"]
+    assert results[1]["skipped"] is True
+    summary = json.loads((output_dir / "batch_summary.json").read_text(encoding="utf-8"))
+    assert summary == json.loads(json.dumps(results))
+
+
+def test_analyze_slide_batch_docker_times_out_only_stuck_slide(temp_dir, sample_slide_json, fake_docker, monkeypatch):
+    """Test a slide the container gets stuck on times out alone; later slides get a new container."""
+    slides_dir = temp_dir / "slides"
+    slides_dir.mkdir()
+    for i in (1, 2, 3):
+        (slides_dir / f"slide_00{i}.json").write_text(json.dumps(sample_slide_json), encoding="utf-8")
+    monkeypatch.setattr(batch_analyzer, "SLIDE_TIMEOUT_S", 2)
+
+    results = analyze_slide_batch_docker(str(slides_dir), str(temp_dir / "output"))
+
+    assert [r.get("error") for r in results] == [None, "Analysis timed out", None]
+    assert results[2]["slide_id"] == "fake"
@@ -0,0 +1,35 @@
+"""Tests for the command line interface."""
+
+import json
+
+from click.testing import CliRunner
+from src.cli import main
+
+
+def test_serve_answers_one_line_per_request(temp_dir, sample_slide_json):
+    """Test serve mode analyzes each NDJSON request and reports errors in-band."""
+    slide_path = temp_dir / "slide.json"
+    slide_path.write_text(json.dumps(sample_slide_json), encoding="utf-8")
+    out_json = temp_dir / "out" / "result.json"
+    requests = [
+        {"slide_json": str(slide_path), "out_json": str(out_json), "out_html": str(temp_dir / "out" / "report.html")},
+        {"slide_json": str(temp_dir / "missing.json")},
+    ]
+    stdin = "".join(json.dumps(r) + "\n" for r in requests)
+
+    result = CliRunner().invoke(main, ["--serve"], input=stdin)
+
+    assert result.exit_code == 0
+    ok, failed = [json.loads(line) for line in result.output.splitlines()]
+    assert ok["slide_id"] == sample_slide_json["id"]
+    assert ok["summary"] == json.loads(out_json.read_text(encoding="utf-8"))["summary"]
+    assert failed["slide_json"] == str(temp_dir / "missing.json")
+    assert "error" in failed
+
+
+def test_slide_json_required_without_serve():
+    """Test --slide-json is still required for a single analysis."""
+    result = CliRunner().invoke(main, [])
+
+    assert result.exit_code == 2
+    assert "--slide-json" in result.output
@@ -1,7 +1,14 @@
 """Tests for color_parser module."""
 
 import pytest
-from src.color_parser import parse_color_from_css, blend_over, convert_hsl_to_rgb, parse_font_size_px, parse_style, RGBA
+from src.color_parser import (
+    parse_color_from_css,
+    blend_over,
+    convert_hsl_to_rgb,
+    parse_font_size_px,
+    parse_style,
+    RGBA,
+)
 
 
 def test_hex6_parsing():
@@ -28,6 +35,24 @@ def test_hex3_parsing():
     assert rgba.r == 255
     assert rgba.g == 0
     assert rgba.b == 0
+    assert parse_color_from_css("#AbC") == RGBA(0xAA, 0xBB, 0xCC, 1.0)
+
+
+def test_hex_invalid_digits():
+    """Test hex strings that int() would accept but CSS does not."""
+    for color in ["#0x1234", "#12_345", "#+12345", "#12345g", "#+12", "#g00"]:
+        with pytest.raises(ValueError):
+            parse_color_from_css(color)
+
+
+def test_parsed_colors_are_immutable():
+    """Test parsed colors can be shared safely: RGBA is frozen and hashable."""
+    first = parse_color_from_css(" #F00 ")
+    with pytest.raises(AttributeError):
+        first.a = 0.5
+
+    assert parse_color_from_css(" #F00 ") == RGBA(255, 0, 0, 1.0)
+    assert len({first, RGBA(255, 0, 0, 1.0)}) == 1
 
 
 def test_rgb_parsing():
@@ -101,6 +126,12 @@ def test_parse_font_size_px():
 
     # em to px (assume 16px base)
     assert parse_font_size_px("1.5em") == 24.0
+    assert parse_font_size_px("1.5rem") == 24.0
+
+    # Raw numbers are px; unparseable sizes give None
+    assert parse_font_size_px("20") == 20.0
+    assert parse_font_size_px("rem") is None
+    assert parse_font_size_px("large") is None
 
 
 def test_parse_style():
@@ -111,3 +142,12 @@ def test_parse_style():
     assert style_dict["color"] == "red"
     assert style_dict["font-size"] == "16px"
     assert style_dict["font-weight"] == "bold"
+
+
+def test_parse_style_returns_independent_dicts():
+    """Test cached style parsing still hands out a fresh dict per call."""
+    style_dict = parse_style("color: red; font-size: 16px")
+    style_dict["color"] = "blue"
+
+    assert parse_style("color: red; font-size: 16px") == {"color": "red", "font-size": "16px"}
+    assert parse_style("") == {}
@@ -0,0 +1,111 @@
+"""Tests for contrast checker orchestration."""
+
+import json
+from pathlib import Path
+
+import pytest
+from src.contrast_checker import analyze_slide, analyze_text_colors
+
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+PLAIN_TYPES = (dict, list, tuple, str, int, float, bool, type(None))
+
+
+def _assert_plain_python(value, path="result"):
+    """Recursively check that a value contains no NumPy scalars or arrays."""
+    assert isinstance(value, PLAIN_TYPES), f"{path}: {type(value).__name__}"
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _assert_plain_python(item, f"{path}.{key}")
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            _assert_plain_python(item, f"{path}[{i}]")
+
+
+@pytest.mark.parametrize("ml_method", ["mediancut", "kmeans"])
+def test_analyze_slide_result_is_plain_json(temp_dir, ml_method):
+    """Test results are built from plain Python types and serialize as-is."""
+    slide = {
+        "id": "slide-001",
+        "content_html": """
+            <div id="text-1"><span style="color: #777777; font-size: 16px;">Low contrast</span></div>
+            <div id="text-2"><span style="color: #000000; font-size: 24px;">Title</span></div>
+        """,
+    }
+    slide_path = temp_dir / "slide.json"
+    slide_path.write_text(json.dumps(slide), encoding="utf-8")
+
+    result = analyze_slide(str(slide_path), bg_image_path=str(EXAMPLES_DIR / "background.png"), ml_method=ml_method)
+
+    _assert_plain_python(result)
+    assert json.loads(json.dumps(result))["summary"]["total_entities"] == 2
+
+
+def test_analyze_slide_base_color_skips_image(temp_dir, sample_slide_json):
+    """Test background image is not decoded when base_color decides the background."""
+    slide_path = temp_dir / "slide.json"
+    slide_path.write_text(json.dumps(sample_slide_json), encoding="utf-8")
+    not_an_image = temp_dir / "background.png"
+    not_an_image.write_bytes(b"not an image")
+
+    result = analyze_slide(str(slide_path), bg_image_path=str(not_an_image))
+
+    assert result["background"]["effective_rgb"] == (230, 242, 255)
+    assert result["background"]["source"] == "base_color: #e6f2ff"
+
+
+def test_analyze_slide_missing_background_with_base_color(temp_dir, sample_slide_json):
+    """Test a missing background image is reported even when base_color is set."""
+    slide_path = temp_dir / "slide.json"
+    slide_path.write_text(json.dumps(sample_slide_json), encoding="utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        analyze_slide(str(slide_path), bg_image_path=str(temp_dir / "missing.png"))
+
+
+def test_analyze_slide_from_slide_data_matches_file(temp_dir, sample_slide_json):
+    """Test analyzing an in-memory slide gives the same result as loading it from disk."""
+    slide_path = temp_dir / "slide.json"
+    slide_path.write_text(json.dumps(sample_slide_json), encoding="utf-8")
+
+    assert analyze_slide(slide_data=sample_slide_json) == analyze_slide(str(slide_path))
+
+
+def test_analyze_slide_requires_source():
+    """Test a slide path or slide data is required."""
+    with pytest.raises(ValueError):
+        analyze_slide()
+
+
+def test_analyze_slide_invalid_json(temp_dir):
+    """Test unreadable slide files raise the documented errors."""
+    bad_path = temp_dir / "bad.json"
+    bad_path.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        analyze_slide(str(bad_path))
+    with pytest.raises(FileNotFoundError):
+        analyze_slide(str(temp_dir / "missing.json"))
+
+
+def test_analyze_text_colors_single_color_is_one_row():
+    """Test spans sharing one color collapse into a single full-weight row."""
+    spans = [
+        {"style": "color: #333333; font-size: 24px", "text": "Title"},
+        {"style": "font-size: 12px; color: #333333", "text": "body text"},
+    ]
+
+    assert analyze_text_colors(spans, "#000000") == [((51, 51, 51), "#333333", 1.0)]
+
+
+def test_analyze_text_colors_weights_by_size_and_length():
+    """Test mixed colors are weighted by font size times text length."""
+    spans = [
+        {"style": "color: #ff0000; font-size: 10px", "text": "ab"},
+        {"style": "font-size: 20px", "text": "abc"},
+    ]
+
+    colors = analyze_text_colors(spans, "#000000")
+
+    assert colors == [((0, 0, 0), "#000000", 0.75), ((255, 0, 0), "#ff0000", 0.25)]
@@ -190,6 +190,43 @@ def test_extract_entities_text_content():
     assert "World" in entities[0]["text_content"]
 
 
+def test_extract_entities_text_content_skips_comments_and_scripts():
+    """Test comments and script/style bodies are not counted as text."""
+    html = """
+    <div id="text-1">
+        <!-- hidden -->
+        <script>var x = 1;</script>
+        <style>.a { color: red; }</style>
+        <span style="color: #000">Visible<!-- note --> text</span>
+    </div>
+    """
+
+    entities = extract_entities(html)
+
+    assert entities[0]["text_content"] == "Visibletext"
+    assert entities[0]["spans"][0]["text"] == "Visible text"
+
+
+def test_extract_entities_skips_template_content():
+    """Test text inside <template> (never rendered) is not counted."""
+    html = '<div id="text-1">Shown<template><span style="color: red">hidden</span></template></div>'
+
+    entities = extract_entities(html)
+
+    assert entities[0]["text_content"] == "Shown"
+    assert entities[0]["spans"][0]["text"] == ""
+
+
+def test_extract_entities_xml_declaration():
+    """Test content starting with an XML declaration is still parsed."""
+    html = '<?xml version="1.0" encoding="utf-8"?><div id="text-1"><span style="color: red">a</span></div>'
+
+    entities = extract_entities(html)
+
+    assert [e["id"] for e in entities] == ["text-1"]
+    assert extract_entities('<?xml version="1.0"?><!-- nothing -->') == []
+
+
 # ============================================================================
 # Wrapper and Geometry Tests
 # ============================================================================
@@ -491,6 +528,16 @@ def test_extract_entities_raw_html_preserved():
     assert "span" in entities[0]["raw_html"]
 
 
+def test_extract_entities_without_raw_html():
+    """Test raw HTML serialization can be skipped without changing other fields."""
+    html = '<div id="text-1"><span style="color: red;">Content</span></div>'
+
+    entities = extract_entities(html, include_raw_html=False)
+
+    assert entities[0]["raw_html"] is None
+    assert entities[0]["spans"] == extract_entities(html)[0]["spans"]
+
+
 def test_extract_geometry_negative_values():
     """Test handling negative geometry values."""
     entity = {
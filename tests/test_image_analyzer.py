@@ -1,8 +1,16 @@
 """Tests for image analyzer module."""
 
+import numpy as np
 import pytest
 from PIL import Image
-from src.image_analyzer import dominant_colors_mediancut, dominant_colors_kmeans, get_dominant_color_simple, analyze_image_region, DEFAULT_COLOR
+from src.image_analyzer import (
+    dominant_colors_mediancut,
+    dominant_colors_kmeans,
+    get_dominant_color_simple,
+    analyze_image_region,
+    load_image,
+    DEFAULT_COLOR,
+)
 
 
 @pytest.fixture
@@ -167,4 +175,129 @@ def test_dominant_colors_mediancut_k_greater_than_colors(test_image):
     colors = dominant_colors_mediancut(test_image, k=10)
     
     assert len(colors) <= 10  # Should not exceed actual unique colors
-    assert sum(weight for _, weight in colors) == pytest.approx(1.0)
\ No newline at end of file
+    assert sum(weight for _, weight in colors) == pytest.approx(1.0)
+
+def test_input_image_not_modified(single_color_image):
+    """Test that analysis without bbox leaves the caller's image untouched."""
+    before = single_color_image.tobytes()
+
+    dominant_colors_mediancut(single_color_image, k=3)
+    dominant_colors_kmeans(single_color_image, k=3)
+
+    assert single_color_image.size == (100, 100)
+    assert single_color_image.tobytes() == before
+
+
+def test_dominant_colors_kmeans_few_colors_exact():
+    """Test K-means returns exact colors and proportions when k covers all colors."""
+    img = Image.new("RGB", (150, 150), color=(255, 0, 0))
+    img.paste((0, 0, 255), (0, 0, 150, 50))
+
+    colors = dominant_colors_kmeans(img, k=5)
+
+    assert colors == [((255, 0, 0), pytest.approx(2 / 3)), ((0, 0, 255), pytest.approx(1 / 3))]
+
+
+def test_load_image_downscales(tmp_path):
+    """Test load_image caps the longest side and converts to RGB."""
+    path = tmp_path / "large.jpg"
+    Image.new("RGB", (2000, 1000), color=(200, 10, 10)).save(path)
+
+    img = load_image(str(path), max_dim=800)
+
+    assert img.mode == "RGB"
+    assert img.size == (800, 400)
+    assert load_image(str(path), max_dim=None).size == (2000, 1000)
+
+
+def test_dominant_colors_kmeans_single_cluster_is_mean():
+    """Test K-means with k=1 returns the mean color of the region."""
+    img = Image.new("RGB", (150, 150), color=(200, 100, 0))
+    img.paste((100, 0, 50), (0, 0, 150, 50))
+    img.paste((0, 30, 250), (0, 50, 150, 100))
+
+    colors = dominant_colors_kmeans(img, k=1)
+
+    assert colors == [((100, 43, 100), 1.0)]
+
+
+def test_load_image_cached_until_file_changes(tmp_path):
+    """Test repeated loads reuse the decoded image until the file is rewritten."""
+    path = tmp_path / "bg.png"
+    Image.new("RGB", (50, 50), color=(10, 20, 30)).save(path)
+
+    first = load_image(str(path))
+    assert load_image(str(path)) is first
+
+    Image.new("RGB", (60, 40), color=(200, 0, 0)).save(path)
+    reloaded = load_image(str(path))
+
+    assert reloaded is not first
+    assert reloaded.size == (60, 40)
+
+
+def test_dominant_colors_kmeans_weights_cover_full_region():
+    """Test K-means weights are exact pixel proportions, not sample estimates."""
+    rng = np.random.default_rng(0)
+    pixels = np.empty((150, 150, 3), dtype=np.uint8)
+    pixels[:50] = (250, 10, 10)
+    pixels[50:100] = (10, 250, 10)
+    pixels[100:] = (10, 10, 250)
+    pixels = (pixels.astype(np.int16) + rng.integers(-3, 4, pixels.shape)).astype(np.uint8)
+
+    colors = dominant_colors_kmeans(Image.fromarray(pixels), k=3)
+
+    assert len(colors) == 3
+    assert [weight for _, weight in colors] == pytest.approx([1 / 3] * 3)
+
+
+def test_dominant_colors_kmeans_lab_color_space():
+    """Test clustering in CIELAB returns RGB centers close to the source colors."""
+    rng = np.random.default_rng(0)
+    pixels = np.empty((150, 150, 3), dtype=np.uint8)
+    pixels[:50] = (250, 10, 10)
+    pixels[50:100] = (10, 250, 10)
+    pixels[100:] = (10, 10, 250)
+    pixels = (pixels.astype(np.int16) + rng.integers(-3, 4, pixels.shape)).astype(np.uint8)
+
+    colors = dominant_colors_kmeans(Image.fromarray(pixels), k=3, color_space="lab")
+
+    assert [weight for _, weight in colors] == pytest.approx([1 / 3] * 3)
+    centers = sorted(rgb for rgb, _ in colors)
+    for center, expected in zip(centers, [(10, 10, 250), (10, 250, 10), (250, 10, 10)]):
+        assert all(isinstance(c, int) for c in center)
+        assert np.abs(np.array(center) - expected).max() <= 3
+
+
+def test_dominant_colors_kmeans_invalid_color_space(test_image):
+    """Test unsupported color spaces are rejected."""
+    with pytest.raises(ValueError):
+        dominant_colors_kmeans(test_image, color_space="hsv")
+
+
+def test_dominant_colors_kmeans_two_modes_uses_class_means():
+    """Test k=2 on a dark-on-light image returns the mean color of each luminance class."""
+    rng = np.random.default_rng(0)
+    pixels = np.full((150, 150, 3), 235, dtype=np.int16)
+    pixels[60:90, 20:130] = 40
+    noise = rng.integers(-4, 5, pixels.shape)
+    pixels = (pixels + noise).astype(np.uint8)
+
+    colors = dominant_colors_kmeans(Image.fromarray(pixels), k=2)
+
+    dark = np.zeros((150, 150), dtype=bool)
+    dark[60:90, 20:130] = True
+    assert colors[0] == (tuple(int(c) for c in pixels[~dark].mean(axis=0)), pytest.approx(1 - dark.mean()))
+    assert colors[1] == (tuple(int(c) for c in pixels[dark].mean(axis=0)), pytest.approx(dark.mean()))
+
+
+def test_dominant_colors_kmeans_two_hues_same_brightness():
+    """Test k=2 does not merge colors of similar luminance but different hue into one mean."""
+    img = Image.new("RGB", (100, 100), color=(255, 0, 0))
+    img.paste((0, 133, 0), (50, 0, 100, 100))
+    img.paste((255, 255, 255), (0, 0, 5, 5))
+
+    colors = dominant_colors_kmeans(img, k=2)
+
+    assert sorted(rgb for rgb, _ in colors) == [(0, 132, 0), (254, 1, 1)]
+    assert [weight for _, weight in colors] == pytest.approx([0.5, 0.5], abs=0.01)
@@ -0,0 +1,40 @@
+"""Tests for the standalone reference contrast checker."""
+
+import pytest
+from reference.contrast_checker import contrast_ratio, extract_entities_html
+
+
+def _summary(entities):
+    return [(e["id"], e["wrapper_style"], e["spans_styles"]) for e in entities]
+
+
+def test_extract_entities_html_wrapper_inside_entity():
+    """Test each entity gets the wrapper nested in it, not its predecessor's."""
+    html = (
+        '<div id="text-1"><div class="entity__wrapper" style="left: 5px"><span style="color: red">a</span></div></div>'
+        '<div id="text-2"><div class="entity__wrapper" style="left: 9px"><span style="color: blue">b</span></div></div>'
+    )
+
+    assert _summary(extract_entities_html(html)) == [
+        ("text-1", "left: 5px", ["color: red"]),
+        ("text-2", "left: 9px", ["color: blue"]),
+    ]
+
+
+def test_extract_entities_html_id_between_wrapper_class_and_style():
+    """Test an entity id between the wrapper's class and style attributes is found."""
+    html = (
+        '<div id="text-0"><span style="color: blue">x</span></div>'
+        '<div class="entity__wrapper" id="text-1" style="left: 1px"><span style="color: red">a</span></div>'
+    )
+
+    assert _summary(extract_entities_html(html)) == [
+        ("text-0", "", ["color: blue"]),
+        ("text-1", "left: 1px", ["color: red"]),
+    ]
+
+
+def test_contrast_ratio_accepts_any_sequence():
+    """Test lists work as well as tuples (the cache is keyed on tuples internally)."""
+    assert contrast_ratio([0, 0, 0], [255, 255, 255]) == pytest.approx(21.0)
+    assert contrast_ratio((0, 0, 0), [255, 255, 255]) == contrast_ratio((0, 0, 0), (255, 255, 255))
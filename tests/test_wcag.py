@@ -0,0 +1,164 @@
+"""Tests for WCAG contrast module."""
+
+import math
+
+import numpy as np
+import pytest
+from src.wcag import (
+    compute_relative_luminance,
+    compute_contrast_ratio,
+    compute_contrast_ratio_batch,
+    classify_contrast_level,
+    is_large_text,
+    suggest_contrast_fixes,
+)
+
+
+def _reference_luminance(rgb):
+    """Scalar WCAG 2.2 formula used to cross-check the lookup table."""
+
+    def linearize(c):
+        c = c / 255.0
+        if c <= 0.03928:
+            return c / 12.92
+        return math.pow((c + 0.055) / 1.055, 2.4)
+
+    r, g, b = rgb
+    return 0.2126 * linearize(r) + 0.7152 * linearize(g) + 0.0722 * linearize(b)
+
+
+def test_relative_luminance_white_black():
+    """Test luminance of the extreme colors."""
+    assert compute_relative_luminance((255, 255, 255)) == pytest.approx(1.0)
+    assert compute_relative_luminance((0, 0, 0)) == 0.0
+
+
+def test_relative_luminance_matches_formula():
+    """Test lookup table against the scalar formula for every channel value."""
+    for v in range(256):
+        for rgb in [(v, 0, 0), (0, v, 0), (0, 0, v), (v, v, v)]:
+            assert compute_relative_luminance(rgb) == pytest.approx(_reference_luminance(rgb), abs=1e-12)
+
+
+def test_relative_luminance_lut_is_read_only():
+    """Test the shared lookup tables cannot be modified in place."""
+    from src import wcag
+
+    with pytest.raises(ValueError):
+        wcag._SRGB_LUT[0] = 1.0
+    with pytest.raises(ValueError):
+        wcag._LUM_R_LUT[0] = 1.0
+
+
+def test_relative_luminance_returns_python_float():
+    """Test tuple input yields a plain float."""
+    assert type(compute_relative_luminance((10, 20, 30))) is float
+
+
+def test_relative_luminance_array_input():
+    """Test vectorized luminance over an (..., 3) array."""
+    img = np.array([[[255, 255, 255], [0, 0, 0]], [[255, 0, 0], [0, 0, 255]]], dtype=np.uint8)
+    lum = compute_relative_luminance(img)
+
+    assert lum.shape == (2, 2)
+    assert lum[0, 0] == pytest.approx(1.0)
+    assert lum[0, 1] == 0.0
+    assert lum[1, 0] == pytest.approx(0.2126)
+    assert lum[1, 1] == pytest.approx(0.0722)
+
+
+def test_relative_luminance_clamps_out_of_range():
+    """Test out-of-range channels are clamped like CSS does."""
+    assert compute_relative_luminance((300, 300, 300)) == compute_relative_luminance((255, 255, 255))
+    assert compute_relative_luminance((-5, 0, 0)) == 0.0
+
+
+def test_relative_luminance_float_input():
+    """Test float channels use the exact formula."""
+    assert compute_relative_luminance((127.5, 10.0, 0.0)) == pytest.approx(_reference_luminance((127.5, 10.0, 0.0)))
+
+
+def test_contrast_ratio_black_white():
+    """Test maximum contrast ratio."""
+    assert compute_contrast_ratio((0, 0, 0), (255, 255, 255)) == pytest.approx(21.0)
+    assert compute_contrast_ratio((255, 255, 255), (0, 0, 0)) == pytest.approx(21.0)
+
+
+def test_contrast_ratio_same_color():
+    """Test minimum contrast ratio."""
+    assert compute_contrast_ratio((100, 150, 200), (100, 150, 200)) == pytest.approx(1.0)
+
+
+def test_contrast_ratio_non_int_tuple_inputs():
+    """Test float channels and arrays take the general luminance path."""
+    expected = (1.05) / (_reference_luminance((127.5, 0.0, 0.0)) + 0.05)
+
+    assert compute_contrast_ratio((127.5, 0.0, 0.0), (255, 255, 255)) == pytest.approx(expected)
+    assert compute_contrast_ratio(np.array([0, 0, 0]), [255, 255, 255]) == pytest.approx(21.0)
+
+
+def test_contrast_ratio_batch_matches_scalar():
+    """Test batch contrast ratios against the scalar function."""
+    colors1 = [(0, 0, 0), (255, 255, 255), (100, 150, 200), (18, 52, 86)]
+    colors2 = [(255, 255, 255), (255, 255, 255), (30, 30, 30), (250, 240, 230)]
+
+    ratios = compute_contrast_ratio_batch(colors1, colors2)
+
+    assert ratios.shape == (4,)
+    for c1, c2, ratio in zip(colors1, colors2, ratios):
+        assert ratio == pytest.approx(compute_contrast_ratio(c1, c2))
+
+
+def test_contrast_ratio_batch_broadcasts_single_color():
+    """Test batch contrast against one shared color."""
+    ratios = compute_contrast_ratio_batch([(0, 0, 0), (255, 255, 255)], (255, 255, 255))
+
+    assert ratios.tolist() == pytest.approx([21.0, 1.0])
+
+
+def test_suggest_fixes_background_adjustments():
+    """Test darken/lighten suggestions pick the first passing factor."""
+    fixes = suggest_contrast_fixes(1.5, (255, 255, 255), (200, 200, 200), 16, "normal")
+    darken = [f for f in fixes if f["type"] == "darken_background"]
+
+    assert len(darken) == 1
+    assert darken[0]["new_value"] == "rgb(80, 80, 80)"
+    assert darken[0]["expected_ratio"] >= 4.5
+    assert type(darken[0]["expected_ratio"]) is float
+
+
+def test_suggest_fixes_lighten_saturates_channels():
+    """Test lightened backgrounds clamp at 255 instead of overflowing."""
+    fixes = suggest_contrast_fixes(1.5, (90, 90, 90), (150, 230, 40), 16, "normal")
+    lighten = [f for f in fixes if f["type"] == "lighten_background"]
+
+    assert len(lighten) == 1
+    assert lighten[0]["new_value"] == "rgb(180, 255, 48)"
+    assert lighten[0]["expected_ratio"] >= 4.5
+
+
+def test_suggest_fixes_text_colors():
+    """Test inverted/black/white text suggestions keep their order and ratios."""
+    fixes = suggest_contrast_fixes(1.2, (200, 200, 200), (255, 255, 255), 16, "normal")
+    text_fixes = [f for f in fixes if f["type"] in ("invert_text_color", "change_text_color")]
+
+    assert [f["new_value"] for f in text_fixes] == ["#373737", "#000000"]
+    assert text_fixes[1]["expected_ratio"] == pytest.approx(21.0)
+    assert type(text_fixes[0]["expected_ratio"]) is float
+
+
+def test_is_large_text():
+    """Test WCAG large text definition."""
+    assert is_large_text(24, "normal")
+    assert is_large_text(19, "bold")
+    assert is_large_text(19, "700")
+    assert not is_large_text(19, "normal")
+    assert not is_large_text(19, "600")
+    assert not is_large_text(16, "bold")
+
+
+def test_classify_contrast_level_large_text():
+    """Test AAA threshold drops to 4.5 for large text."""
+    assert classify_contrast_level(5.0, 24, "normal")["AAA"]
+    assert not classify_contrast_level(5.0, 16, "normal")["AAA"]
+    assert classify_contrast_level(5.0, 24, "normal")["is_large_text"]